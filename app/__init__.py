@@ -105,7 +105,12 @@ def create_app(test_config: dict | None = None):
     register_error_handlers(app)
 
     if Config.PROVIDER == "local":
-        loop = asyncio.get_event_loop()
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            # No loop set on this thread (e.g. after asyncio.run() closed it)
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
         loop.create_task(warmup_local_models(container))
 
 
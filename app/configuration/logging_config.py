@@ -49,14 +49,17 @@ LOGGING = {
   }
 }
 
-def configure_logging():
-    # Create console handler
-    console = logging.StreamHandler()
-    console.setLevel(logging.DEBUG)
-    fmt = '%(asctime)s %(levelname)-5s %(name)s: %(message)s'
-    console.setFormatter(logging.Formatter(fmt, datefmt='%H:%M:%S'))
-    logging.config.dictConfig(LOGGING)
-
-
+_configured = False
 
 
+def configure_logging(force: bool = False):
+    """
+    Apply LOGGING once per process. Logging is global, so later calls (e.g. from
+    every create_app) would only tear down and re-attach the same root handler.
+    Pass force=True to re-apply it anyway.
+    """
+    global _configured
+    if _configured and not force:
+        return
+    logging.config.dictConfig(LOGGING)
+    _configured = True
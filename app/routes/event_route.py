@@ -3,7 +3,7 @@ from flask import request, abort
 from dependency_injector.wiring import inject, Provide
 from app.container import Container
 from app.services.event_service import EventService
-from app.schemas.event_schema import CreateEventSchema, EventSchema, UpdateEventSchema
+from app.schemas.event_schema import CREATE_EVENT_SCHEMA, EVENT_SCHEMA, EVENTS_SCHEMA, UPDATE_EVENT_SCHEMA
 from app.util.logging_util import log_calls
 from datetime import datetime
 from flask_jwt_extended import jwt_required
@@ -11,12 +11,6 @@ from flask_jwt_extended import jwt_required
 # Namespace for event operations; all routes under '/events'
 event_ns = Namespace("events", description="Event based operations")
 
-# Instantiate Marshmallow schemas for input validation and serialization
-create_event_schema = CreateEventSchema()  # Validates incoming POST data
-update_event_schema = UpdateEventSchema()
-event_schema = EventSchema()               # Serializes a single Event object
-events_schema = EventSchema(many=True)     # Serializes a list of Event objects
-
 
 @log_calls("app.routes")  # Custom decorator for logging entry/exit of methods
 @event_ns.route("")       # Root endpoint for events (e.g., GET /events, POST /events)
@@ -27,7 +21,7 @@ class EventBaseResource(Resource):
             event_service: EventService = Provide[Container.event_service]):
         """Get all events"""
         events = event_service.get_all()                  # Fetch list of Event models
-        return events_schema.dump(events), 200            # Return serialized list with HTTP 200
+        return EVENTS_SCHEMA.dump(events), 200            # Return serialized list with HTTP 200
 
     # Define Swagger model for input payload documentation
     event_create_input = event_ns.model('event_create_input', {
@@ -46,13 +40,13 @@ class EventBaseResource(Resource):
              event_service: EventService = Provide[Container.event_service]):
         """Create a new event"""
         # 1. Validate & deserialize the JSON (still requires organizer_email)
-        data = create_event_schema.load(request.get_json())
+        data = CREATE_EVENT_SCHEMA.load(request.get_json())
 
         # 2. Delegate everything (including email lookup) to the service
         saved = await event_service.create(data)
 
         # 3. Serialize and return the newly created event
-        return event_schema.dump(saved), 201
+        return EVENT_SCHEMA.dump(saved), 201
 
 
 @log_calls("app.routes")
@@ -65,7 +59,7 @@ class EventByTitleResource(Resource):
             event_service: EventService = Provide[Container.event_service]):
         """Get an event by title"""
         event = event_service.get_by_title(title)
-        return event_schema.dump(event), 200
+        return EVENT_SCHEMA.dump(event), 200
 
     @inject
     @jwt_required()
@@ -94,7 +88,7 @@ class EventByTitleResource(Resource):
                   event_service: EventService = Provide[Container.event_service]):
         # 1) Parse & validate incoming JSON
         body = request.get_json() or {}
-        patch = update_event_schema.load(body, partial=True)
+        patch = UPDATE_EVENT_SCHEMA.load(body, partial=True)
 
         if not patch:
             abort(400, description="No valid update fields provided")
@@ -105,7 +99,7 @@ class EventByTitleResource(Resource):
 
 
         # 3) Return updated event
-        return event_schema.dump(updated_event), 200
+        return EVENT_SCHEMA.dump(updated_event), 200
 
 
 @log_calls("app.routes")
@@ -118,7 +112,7 @@ class EventsByLocationResource(Resource):
             event_service: EventService = Provide[Container.event_service]):
         """Get events by location"""
         events = event_service.get_by_location(location)
-        return events_schema.dump(events), 200
+        return EVENTS_SCHEMA.dump(events), 200
 
 
 @log_calls("app.routes")
@@ -131,7 +125,7 @@ class EventsByCategoryResource(Resource):
             event_service: EventService = Provide[Container.event_service]):
         """Get events by category"""
         events = event_service.get_by_category(category)
-        return events_schema.dump(events), 200
+        return EVENTS_SCHEMA.dump(events), 200
 
 
 @log_calls("app.routes")
@@ -144,7 +138,7 @@ class EventsByOrganizerResource(Resource):
             event_service: EventService = Provide[Container.event_service]):
         """Get events by organizer email"""
         events = event_service.get_by_organizer(email)
-        return events_schema.dump(events), 200
+        return EVENTS_SCHEMA.dump(events), 200
 
 
 @log_calls("app.routes")
@@ -162,4 +156,4 @@ class EventsByDateResource(Resource):
         except ValueError:
             abort(400, description="Date must be in 'YYYY-MM-DD' format")
         events = event_service.get_by_date(date_obj)
-        return events_schema.dump(events), 200
+        return EVENTS_SCHEMA.dump(events), 200
@@ -174,4 +174,11 @@ class UpdateEventSchema(Schema):
     datetime = fields.DateTime(
         required=False,
         format="%Y-%m-%d %H:%M:%S"
-    )
\ No newline at end of file
+    )
+
+# Shared, stateless instances: building a Schema resolves its declared fields and
+# validators, so do it once per process rather than per request
+CREATE_EVENT_SCHEMA = CreateEventSchema()
+UPDATE_EVENT_SCHEMA = UpdateEventSchema()
+EVENT_SCHEMA = EventSchema()
+EVENTS_SCHEMA = EventSchema(many=True)
@@ -1,8 +1,13 @@
+import re
+
 from marshmallow import Schema, fields, validate, EXCLUDE, pre_load
 from app.util.user_util import (
     PASSWORD_MAX_LENGTH, PASSWORD_MIN_LENGTH, NAME_MAX_LENGTH, SURNAME_MAX_LENGTH, EMAIL_MAX_LENGTH)
 # Constants for validation lengths
 
+# At least one uppercase letter and one digit; shared by the create and update schemas
+PASSWORD_COMPLEXITY_RE = re.compile(r'^(?=.*[A-Z])(?=.*\d).+$')
+
 
 class CreateUserSchema(Schema):
     """
@@ -95,7 +100,7 @@ class CreateUserSchema(Schema):
                 error="Password must be at least 8 characters long."
             ),
             validate.Regexp(
-                r'^(?=.*[A-Z])(?=.*\d).+$',
+                PASSWORD_COMPLEXITY_RE,
                 error="Password must contain at least one uppercase letter and one number."
             )
         ],
@@ -172,7 +177,7 @@ class UpdateUserSchema(Schema):
                 error="Password must be at least 8 characters long."
             ),
             validate.Regexp(
-                r'^(?=.*[A-Z])(?=.*\d).+$',
+                PASSWORD_COMPLEXITY_RE,
                 error="Password must contain at least one uppercase letter and one number."
             )
         ],
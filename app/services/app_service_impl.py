@@ -29,7 +29,7 @@ class AppServiceImpl(AppService):
         self.user_repo = user_repo
         self.event_repo = event_repo
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def add_participant_to_event(self, event_title: str, user_email: str, session=None) -> None:
         """
@@ -60,7 +60,7 @@ class AppServiceImpl(AppService):
             # Any other DB problem: wrap as a save error
             raise EventSaveException(original_exception=e)
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def remove_participant_from_event(self, event_title: str, user_email: str, session=None) -> None:
         """
@@ -53,7 +53,7 @@ class EventServiceImpl(EventService):
     def get_all(self, session=None) -> List[Event]:
         return self.event_repository.get_all(session)
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def delete_by_title(self, title: str, session=None) -> None:
         event = self.event_repository.get_by_title(title, session)
@@ -142,7 +142,7 @@ class EventServiceImpl(EventService):
 
 
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def _persist(self, event: Event, *, session=None, recheck_title: bool = False,
                  title_for_recheck: str | None = None) -> Event:
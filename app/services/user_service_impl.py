@@ -40,7 +40,7 @@ class UserServiceImpl(UserService):
     def get_all(self, session=None) -> List[User]:
         return self.user_repository.get_all(session)
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def save(self, user: User, session=None) -> User:
         if self.user_repository.get_by_email(user.email, session):
@@ -51,7 +51,7 @@ class UserServiceImpl(UserService):
             raise UserSaveException(original_exception=e)
 
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def update(self, email: str, data: Dict[str, Any], session=None) -> User:
 
@@ -71,7 +71,7 @@ class UserServiceImpl(UserService):
             raise UserSaveException(original_exception=e)
 
 
-    @retry_conflicts(max_retries=3, backoff_sec=0.1)
+    @retry_conflicts(max_retries=3, base_backoff_sec=0.1)
     @transactional
     def delete_by_id(self, user_id: int, session=None) -> None:
         user = self.user_repository.get_by_id(user_id, session)
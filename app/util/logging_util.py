@@ -74,15 +74,16 @@ def _wrap_method(method: Callable, layer: str, cls_name: str, method_name: str)
         A wrapped method that logs calls and re-raises exceptions.
     """
     logger = logging.getLogger(layer)
+    level = get_log_level(layer)
+    full = f"{cls_name}.{method_name}"
 
     @wraps(method)
     def wrapped(self, *args, **kwargs):
-        full = f"{cls_name}.{method_name}"
-        logger.log(get_log_level(layer), f"{full}() called.")
+        logger.log(level, "%s() called.", full)
         try:
             return method(self, *args, **kwargs)
         except Exception as e:
-            logger.error(f"{full}() failed with {type(e).__name__}: {e}")
+            logger.error("%s() failed with %s: %s", full, type(e).__name__, e)
             raise
 
     return wrapped
@@ -102,15 +103,16 @@ def _wrap_classmethod(func: Callable, layer: str, cls_name: str, method_name: st
         A wrapped classmethod that logs calls and re-raises exceptions.
     """
     logger = logging.getLogger(layer)
+    level = get_log_level(layer)
+    full = f"{cls_name}.{method_name}"
 
     @wraps(func)
     def wrapped(cls, *args, **kwargs):
-        full = f"{cls_name}.{method_name}"
-        logger.log(get_log_level(layer), f"{full}() called.")
+        logger.log(level, "%s() called.", full)
         try:
             return func(cls, *args, **kwargs)
         except Exception as e:
-            logger.error(f"{full}() failed with {type(e).__name__}: {e}")
+            logger.error("%s() failed with %s: %s", full, type(e).__name__, e)
             raise
 
     return wrapped
@@ -130,15 +132,16 @@ def _wrap_staticmethod(func: Callable, layer: str, cls_name: str, method_name: s
         A wrapped function preserving staticmethod behavior.
     """
     logger = logging.getLogger(layer)
+    level = get_log_level(layer)
+    full = f"{cls_name}.{method_name}"
 
     @wraps(func)
     def wrapped(*args, **kwargs):
-        full = f"{cls_name}.{method_name}"
-        logger.log(get_log_level(layer), f"{full}() called.")
+        logger.log(level, "%s() called.", full)
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"{full}() failed with {type(e).__name__}: {e}")
+            logger.error("%s() failed with %s: %s", full, type(e).__name__, e)
             raise
 
     return wrapped
@@ -156,15 +159,16 @@ def _wrap_function(func: Callable, layer: str) -> Callable:
         A wrapped function that logs calls and re-raises exceptions.
     """
     logger = logging.getLogger(layer)
+    level = get_log_level(layer)
+    name = func.__name__
 
     @wraps(func)
     def wrapped(*args, **kwargs):
-        name = func.__name__
-        logger.log(get_log_level(layer), f"{name}() called.")
+        logger.log(level, "%s() called.", name)
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.error(f"{name}() failed with {type(e).__name__}: {e}")
+            logger.error("%s() failed with %s: %s", name, type(e).__name__, e)
             raise
 
     return wrapped
@@ -1,7 +1,9 @@
 # app/util/transaction_util.py
 
+import random
 from functools import wraps
 from time import sleep
+from typing import Callable
 from contextlib import nullcontext
 from sqlalchemy.orm.exc import StaleDataError
 from app.extensions import db
@@ -14,7 +16,27 @@ def _current_session():
     return s() if callable(s) else s  # unwrap if it's a scoped_session
 
 
-def retry_conflicts(max_retries: int = 3, backoff_sec: float = 0.1):
+def retry_conflicts(max_retries: int = 3,
+                    base_backoff_sec: float = 0.05,
+                    max_backoff_sec: float = 1.0,
+                    backoff_sec: float | None = None,
+                    *,
+                    _rng: Callable[[], float] = random.random,
+                    _sleep: Callable[[float], None] = sleep):
+    """
+    Retry on ConcurrencyException with full-jitter exponential backoff.
+
+    Before retry n the wrapper sleeps a random delay in
+    [0, min(max_backoff_sec, base_backoff_sec * 2**(n-1))), so competing writers
+    de-synchronize instead of colliding again on the same schedule.
+
+    `backoff_sec` is the legacy name for `base_backoff_sec`; `backoff_sec=0` disables backoff.
+    `_rng` returns a float in [0, 1) and can be seeded in tests; `_sleep` can be replaced
+    with a no-op so tests run the retry loop without touching the clock.
+    """
+    if backoff_sec is not None:
+        base_backoff_sec = backoff_sec
+
     def decorator(fn):
         @wraps(fn)
         def wrapped(*args, **kwargs):
@@ -25,7 +47,10 @@ def retry_conflicts(max_retries: int = 3, backoff_sec: float = 0.1):
                     _current_session().rollback()
                     if attempt == max_retries:
                         raise
-                    sleep(backoff_sec * attempt)
+                    cap = min(max_backoff_sec, base_backoff_sec * (2 ** (attempt - 1)))
+                    delay = _rng() * cap
+                    if delay > 0:
+                        _sleep(delay)
         return wrapped
     return decorator
 
@@ -8,19 +8,19 @@ from app.configuration.logging_config import configure_logging
 from app.util.logging_util import log_calls, get_log_level
 
 
-@pytest.fixture(autouse=True)
-def reset_and_setup_logging():
-    # 1) Tear down any existing loggers/handlers
-    logging.shutdown()
-    for name in list(logging.root.manager.loggerDict):
-        logging.root.manager.loggerDict.pop(name)
+def _records_for(caplog, name: str) -> list[logging.LogRecord]:
+    """Records from the test's call phase emitted by the given logger."""
+    return [r for r in caplog.get_records("call") if r.name == name]
+
 
-    # 2) Apply your dictConfig
+@pytest.fixture(scope="module", autouse=True)
+def _logging_once():
+    # dictConfig sets every logger these tests inspect, and caplog.at_level restores
+    # levels after each test, so one configuration serves the whole module
     configure_logging()
 
     yield
 
-    # 3) Clean up again
     logging.shutdown()
 
 
@@ -53,49 +53,66 @@ def test_configure_logging_other_loggers_and_root():
 
 def test_configure_logging_idempotent():
     before = list(logging.getLogger("app").handlers)
+    root_before = list(logging.getLogger().handlers)
     configure_logging()
     after = list(logging.getLogger("app").handlers)
     # no duplicate handlers created
     assert before == after
+    # repeat calls are no-ops, so the root console handler is not replaced
+    assert logging.getLogger().handlers == root_before
+
 
+def test_configure_logging_force_reapplies_config(monkeypatch):
+    werkzeug = logging.getLogger("werkzeug")
+    monkeypatch.setattr(werkzeug, "level", logging.DEBUG)
 
-def test_get_log_level_variants():
-    # "route"/"service" → INFO; everything else → DEBUG
-    assert get_log_level("app.routes") == logging.INFO
-    assert get_log_level("order.service") == logging.INFO
-    assert get_log_level("some.Services") == logging.INFO
+    configure_logging()
+    # a plain repeat call leaves the drifted level alone
+    assert werkzeug.level == logging.DEBUG
 
-    assert get_log_level("app.repositories") == logging.DEBUG
-    assert get_log_level("custom.layer") == logging.DEBUG
+    root_before = list(logging.getLogger().handlers)
+    configure_logging(force=True)
+    assert werkzeug.level == logging.ERROR
+    # dictConfig built a fresh root console handler
+    assert logging.getLogger().handlers != root_before
 
 
-def test_log_calls_wraps_free_function(caplog):
-    caplog.set_level(logging.INFO, logger="app.services")
+# "route"/"service" → INFO; everything else → DEBUG
+@pytest.mark.parametrize("layer,expected", [
+    ("app.routes", logging.INFO),
+    ("order.service", logging.INFO),
+    ("some.Services", logging.INFO),
+    ("app.repositories", logging.DEBUG),
+    ("custom.layer", logging.DEBUG),
+])
+def test_get_log_level_variants(layer, expected):
+    assert get_log_level(layer) == expected
+
 
+def test_log_calls_wraps_free_function(caplog):
     @log_calls("app.services")
     def add(x, y):
         return x + y
 
-    assert add(2, 3) == 5
+    with caplog.at_level(logging.INFO, logger="app.services"):
+        assert add(2, 3) == 5
 
-    recs = [r for r in caplog.records if r.name == "app.services"]
+    recs = _records_for(caplog, "app.services")
     assert len(recs) == 1
     assert recs[0].levelno == logging.INFO
     assert recs[0].getMessage() == "add() called."
 
 
 def test_log_calls_function_exception(caplog):
-    # capture both INFO entry and ERROR exception
-    caplog.set_level(logging.DEBUG, logger="app.services")
-
     @log_calls("app.services")
     def fail():
         raise ValueError("boom!")
 
-    with pytest.raises(ValueError):
+    # capture both INFO entry and ERROR exception
+    with caplog.at_level(logging.DEBUG, logger="app.services"), pytest.raises(ValueError):
         fail()
 
-    recs = [r for r in caplog.records if r.name == "app.services"]
+    recs = _records_for(caplog, "app.services")
     # entry log at INFO
     assert any(r.levelno == logging.INFO and "fail() called." in r.getMessage()
                for r in recs)
@@ -105,9 +122,6 @@ def test_log_calls_function_exception(caplog):
                for r in recs)
 
 def test_log_calls_wraps_all_class_methods(caplog):
-    # capture DEBUG-level logs for repository layer
-    caplog.set_level(logging.DEBUG, logger="app.repositories")
-
     @log_calls("app.repositories")
     class Sample:
         def foo(self):
@@ -125,47 +139,59 @@ def test_log_calls_wraps_all_class_methods(caplog):
             return "static"
 
     inst = Sample()
-    assert inst.foo() == "foo"
-    assert inst.bar() == "bar"
-    assert inst.cls_method() == "cls"
-    assert inst.static_method() == "static"
+    # capture DEBUG-level logs for repository layer
+    with caplog.at_level(logging.DEBUG, logger="app.repositories"):
+        assert inst.foo() == "foo"
+        assert inst.bar() == "bar"
+        assert inst.cls_method() == "cls"
+        assert inst.static_method() == "static"
 
-    recs = [r.getMessage() for r in caplog.records if r.name == "app.repositories"]
     # All four methods should have been wrapped and logged at DEBUG level
-    assert "Sample.foo() called." in recs
-    assert "Sample.bar() called." in recs
-    assert "Sample.cls_method() called." in recs
-    assert "Sample.static_method() called." in recs
+    assert {r.getMessage() for r in _records_for(caplog, "app.repositories")} >= {
+        "Sample.foo() called.",
+        "Sample.bar() called.",
+        "Sample.cls_method() called.",
+        "Sample.static_method() called.",
+    }
 
 
 def test_log_calls_class_method_exception(caplog):
-    # capture both INFO entry and ERROR exception
-    caplog.set_level(logging.DEBUG, logger="app.repositories")
-
     @log_calls("app.repositories")
     class Bomb:
         def explode(self):
             raise RuntimeError("kaboom")
 
     b = Bomb()
-    with pytest.raises(RuntimeError):
+    # capture both INFO entry and ERROR exception
+    with caplog.at_level(logging.DEBUG, logger="app.repositories"), pytest.raises(RuntimeError):
         b.explode()
 
-    recs = [r.getMessage() for r in caplog.records if r.name == "app.repositories"]
+    recs = {r.getMessage() for r in _records_for(caplog, "app.repositories")}
     assert "Bomb.explode() called." in recs
     assert "Bomb.explode() failed with RuntimeError: kaboom" in recs
 
 
 def test_log_calls_unknown_layer_defaults_to_debug(caplog):
-    caplog.set_level(logging.DEBUG, logger="mystery.layer")
-
     @log_calls("mystery.layer")
     def mystery():
         return "?"
 
-    assert mystery() == "?"
+    with caplog.at_level(logging.DEBUG, logger="mystery.layer"):
+        assert mystery() == "?"
 
-    recs = [r for r in caplog.records if r.name == "mystery.layer"]
+    recs = _records_for(caplog, "mystery.layer")
     assert len(recs) == 1
     assert recs[0].levelno == logging.DEBUG
-    assert recs[0].getMessage() == "mystery() called."
\ No newline at end of file
+    assert recs[0].getMessage() == "mystery() called."
+
+
+def test_log_calls_below_logger_level_emits_nothing(caplog):
+    @log_calls("app.services")
+    def add(x, y):
+        return x + y
+
+    # entry logs are INFO for services, so a WARNING threshold drops them
+    with caplog.at_level(logging.WARNING, logger="app.services"):
+        assert add(1, 2) == 3
+
+    assert _records_for(caplog, "app.services") == []
@@ -0,0 +1,85 @@
+import os
+from collections import Counter
+
+import psycopg2
+import pytest
+from psycopg2 import sql
+from sqlalchemy.orm import configure_mappers
+
+from app import create_app
+from app.extensions import db
+
+
+def _ensure_database(name: str) -> None:
+    """Create the given database next to TEST_DB_NAME if it does not exist yet."""
+    conn = psycopg2.connect(
+        dbname=os.getenv("TEST_DB_NAME"),
+        user=os.getenv("TEST_DB_USER"),
+        password=os.getenv("TEST_DB_PASSWORD"),
+        host=os.getenv("TEST_DB_HOST"),
+        port=os.getenv("TEST_DB_PORT"),
+    )
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,))
+            if cur.fetchone() is None:
+                cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name)))
+    finally:
+        conn.close()
+
+
+def pytest_configure(config):
+    """
+    Under pytest-xdist every worker gets its own database (e.g. test_database_gw0),
+    so session-scoped apps and per-test cleanup never race across workers.
+    Runs before test modules are imported, so every test_cfg picks up the worker name.
+    Mappers are configured here too (create_app's import already loaded every model),
+    so the first test to build a User or Event doesn't pay for it.
+    """
+    configure_mappers()
+
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        return
+    name = f"{os.getenv('TEST_DB_NAME')}_{worker}"
+    _ensure_database(name)
+    os.environ["TEST_DB_NAME"] = name
+
+
+@pytest.fixture(scope="session")
+def setup_calls():
+    """Counts expensive setup steps so guard tests can pin fixture scopes."""
+    return Counter()
+
+
+@pytest.fixture(scope="session")
+def app(setup_calls):
+    """
+    One application per test session. Blueprints, JWT, DB and DI wiring are set up once
+    and the schema is rebuilt once; tests that need per-request state use
+    app.test_request_context() instead of a new app.
+    Modules that need a differently configured app still define their own `app` fixture.
+    """
+    from tests.util.util_test import test_cfg
+
+    app = create_app(test_cfg)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        setup_calls["create_all"] += 1
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def teardown_checks():
+    """
+    Errors collected by other fixtures' finalizers. Cleanup steps append here instead of
+    raising, so one failing step (e.g. a dropped connection) does not skip the rest and
+    leak connections into later tests; anything collected fails the test at teardown.
+    """
+    errors = []
+    yield errors
+    if errors:
+        raise RuntimeError(f"teardown failed: {errors!r}")
@@ -9,10 +9,14 @@ from app.error_handler.exceptions import (
 )
 from app.error_handler.global_error_handler import register_error_handlers
 
-@pytest.fixture
-# Create a minimal Flask app with the global error handlers registered
+@pytest.fixture(scope="session")
+# Create a minimal Flask app with the global error handlers registered (built once;
+# the throwaway routes below are stateless, so every test can share it)
 def app():
     app = Flask(__name__)
+    app.config["TESTING"] = True
+    # JSON_SORT_KEYS is gone in Flask 3; the provider attribute replaces it
+    app.json.sort_keys = False
     register_error_handlers(app)
 
     @app.route("/notfound/<int:id>")
@@ -34,7 +38,7 @@ def app():
 
     return app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 # Provide the Flask test client for sending requests
 def client(app):
     return app.test_client()
@@ -42,8 +46,9 @@ def client(app):
 # Ensure UserNotFoundException triggers a 404 with the correct error code and message
 def test_user_not_found_handler(client):
     resp = client.get("/notfound/42")
+    body = resp.get_json()
     assert resp.status_code == 404
-    assert resp.get_json() == {
+    assert body == {
         "error": {
             "code": "USER_NOT_FOUND",
             "message": "User with id=42 not found."
@@ -53,8 +58,9 @@ def test_user_not_found_handler(client):
 # Verify DuplicateEmailException returns a 409 and proper payload
 def test_duplicate_email_handler(client):
     resp = client.get("/duplicate-email")
+    body = resp.get_json()
     assert resp.status_code == 409
-    assert resp.get_json() == {
+    assert body == {
         "error": {
             "code": "DUPLICATE_EMAIL",
             "message": "User with email foo@bar.com already exists."
@@ -64,15 +70,15 @@ def test_duplicate_email_handler(client):
 # Confirm UserSaveException yields a 500 and includes generic save error text
 def test_user_save_exception_handler(client):
     resp = client.get("/save-error")
+    body = resp.get_json()
     assert resp.status_code == 500
-    payload = resp.get_json()["error"]
-    assert payload["code"] == "USER_SAVE_ERROR"
-    assert "Unable to save user due to an internal error." in payload["message"]
+    assert body["error"]["code"] == "USER_SAVE_ERROR"
+    assert "Unable to save user due to an internal error." in body["error"]["message"]
 
 # Confirm UserDeleteException yields a 500 and includes generic delete error text
 def test_user_delete_exception_handler(client):
     resp = client.get("/delete-error")
+    body = resp.get_json()
     assert resp.status_code == 500
-    payload = resp.get_json()["error"]
-    assert payload["code"] == "USER_DELETE_ERROR"
-    assert "Unable to delete user with id=99." in payload["message"]
+    assert body["error"]["code"] == "USER_DELETE_ERROR"
+    assert "Unable to delete user with id=99." in body["error"]["message"]
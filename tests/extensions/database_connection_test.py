@@ -1,16 +1,11 @@
 import pytest
 from sqlalchemy import text
-from app import create_app
 from app.extensions import db
-from tests.util.util_test import test_cfg
 
-@pytest.fixture
-def app():
+pytestmark = pytest.mark.slow
 
-    app = create_app(test_cfg)
-    with app.app_context():
-        yield app
+PING = text("SELECT 1")
 
 def test_postgres_connection_success(app):
-    result = db.session.execute(text("SELECT 1"))
-    assert result.scalar() == 1
\ No newline at end of file
+    with app.app_context():
+        assert db.session.scalar(PING) == 1
@@ -3,7 +3,6 @@
 import pytest
 from datetime import datetime
 
-from app import create_app
 from app.configuration.config import Config
 from app.extensions import db as _db
 from app.models.event import Event, guest_list
@@ -16,19 +15,10 @@ from app.constants import (
 )
 from sqlalchemy.orm import scoped_session, sessionmaker
 
+pytestmark = pytest.mark.slow
 
-# ---------- App / DB setup ----------
-
-@pytest.fixture(scope="session")
-def app():
-    from tests.util.util_test import test_cfg
-    app = create_app(test_cfg)
-    with app.app_context():
-        _db.drop_all()
-        _db.create_all()
-        yield app
-        _db.session.remove()
 
+# ---------- App / DB setup ----------
 
 @pytest.fixture(autouse=True)
 def clean_db(app):
@@ -38,18 +28,24 @@ def clean_db(app):
         _db.session.commit()
 
 
+@pytest.fixture(scope="module")
+def _session_registry():
+    return scoped_session(sessionmaker())
+
+
 @pytest.fixture
-def db_session(app):
+def db_session(app, _session_registry, teardown_checks):
     connection = _db.engine.connect()
     transaction = connection.begin()
-    session_factory = sessionmaker(bind=connection)
-    session = scoped_session(session_factory)
+    _session_registry.configure(bind=connection)
 
-    yield session
+    yield _session_registry
 
-    session.remove()
-    transaction.rollback()
-    connection.close()
+    for cleanup in (_session_registry.remove, transaction.rollback, connection.close):
+        try:
+            cleanup()
+        except Exception as exc:
+            teardown_checks.append(exc)
 
 
 # ---------- Tests ----------
@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from app.extensions import db as _db
+
+
+@pytest.fixture(scope="session")
+def _engine(app):
+    """The shared app's engine (and its pool), reused by every repository test."""
+    with app.app_context():
+        return _db.engine
+
+
+@pytest.fixture(scope="session")
+def _session_registry():
+    """
+    One scoped_session registry for the run; each test binds its own connection and
+    remove()s its session at teardown.
+    With join_transaction_mode="create_savepoint", commit()/rollback() in tests only
+    release or roll back SAVEPOINTs. expire_on_commit=False skips the refresh SELECTs
+    that would otherwise follow each commit.
+    """
+    return scoped_session(
+        sessionmaker(join_transaction_mode="create_savepoint", expire_on_commit=False)
+    )
+
+
+@pytest.fixture
+def db_session(_engine, _session_registry, teardown_checks):
+    """Session joined to an outer transaction that is rolled back at teardown."""
+    connection = _engine.connect()
+    transaction = connection.begin()
+    _session_registry.configure(bind=connection)
+
+    yield _session_registry
+
+    for cleanup in (_session_registry.remove, transaction.rollback, connection.close):
+        try:
+            cleanup()
+        except Exception as exc:
+            teardown_checks.append(exc)
+
+
+@pytest.fixture
+def query_counter(_engine):
+    """
+    SQL statements sent through the test engine while the test runs. Take len() before
+    and after a repository call to pin how many round-trips it makes (N+1 guard).
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(_engine, "before_cursor_execute", _record)
@@ -1,47 +1,28 @@
 # tests/repositories/event_repository_impl_test.py
 
 import pytest
-from datetime import datetime, timedelta
-from sqlalchemy.orm import scoped_session, sessionmaker
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
 
-from app import create_app
 from app.extensions import db as _db
 from app.models.event import Event
 from app.models.user import User
 from app.repositories.event_repository_impl import EventRepositoryImpl
 from app.configuration.config import Config
-from tests.util.util_test import test_cfg
+from tests.util.factories import make_event
 
+pytestmark = pytest.mark.slow
 
-@pytest.fixture(scope="session")
-def app():
-    app = create_app(test_cfg)
-    with app.app_context():
-        _db.drop_all()
-        _db.create_all()
-        yield app
-        _db.session.remove()
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def clean_db(app):
+    """Start the module from empty tables; each test is then isolated by db_session's rollback."""
     with app.app_context():
         for table in reversed(_db.metadata.sorted_tables):
             _db.session.execute(table.delete())
         _db.session.commit()
 
-@pytest.fixture
-def db_session(app):
-    connection = _db.engine.connect()
-    transaction = connection.begin()
-    session_factory = sessionmaker(bind=connection)
-    session = scoped_session(session_factory)
-
-    yield session
-
-    session.remove()
-    transaction.rollback()
-    connection.close()
-
 # ---------- Repo + helper fixtures ----------
 
 @pytest.fixture
@@ -57,7 +38,7 @@ def organizer_user(db_session):
         password="dummy-hash",
     )
     db_session().add(u)
-    db_session.commit()
+    db_session.flush()
     return u
 
 @pytest.fixture
@@ -65,7 +46,7 @@ def now():
     return datetime(2025, 1, 1, 10, 0, 0)
 
 @pytest.fixture
-def events_fixture(event_repo, db_session, organizer_user, now):
+def events_fixture(db_session, organizer_user, now):
     data = [
         {"title": "Tech Conference 2025", "datetime": now + timedelta(days=5, hours=14),
          "description": "Annual technology conference featuring speakers from major tech companies.",
@@ -84,21 +65,27 @@ def events_fixture(event_repo, db_session, organizer_user, now):
          "location": "Central Park, New York", "category": "Entertainment"},
     ]
     dummy_vec = [0.0] * Config.UNIFIED_VECTOR_DIM
-    out = []
-    for e in data:
-        ev = Event(
-            title=e["title"],
-            datetime=e["datetime"],
-            description=e["description"],
-            organizer_id=organizer_user.id,
-            location=e["location"],
-            category=e["category"],
-            embedding=dummy_vec,
-        )
-        saved = event_repo.save(ev, db_session())  # save with session()
-        db_session.commit()
-        out.append(saved)
-    return out
+    events = [make_event(**e, organizer_id=organizer_user.id, embedding=dummy_vec) for e in data]
+    # save() is a plain session.add, so stage everything and flush once
+    db_session.add_all(events)
+    db_session.flush()
+    return events
+
+
+class EventsIndex(NamedTuple):
+    by_date: dict[date, list[Event]]
+    by_location: dict[str, list[Event]]
+    by_category: dict[str, list[Event]]
+
+@pytest.fixture
+def events_index(events_fixture):
+    """events_fixture grouped once by the keys the repository filters on."""
+    index = EventsIndex(defaultdict(list), defaultdict(list), defaultdict(list))
+    for e in events_fixture:
+        index.by_date[e.datetime.date()].append(e)
+        index.by_location[e.location].append(e)
+        index.by_category[e.category].append(e)
+    return index
 
 
 # ---------- Tests ----------
@@ -126,10 +113,10 @@ def test_get_by_organizer_id(event_repo, events_fixture, db_session):
     assert len(events) == len(events_fixture)
     assert {e.id for e in events_fixture}.issubset({e.id for e in events})
 
-def test_get_by_date(event_repo, events_fixture, now, db_session):
+def test_get_by_date(event_repo, events_index, now, db_session):
     target_date = (now + timedelta(days=5)).date()
     fetched = event_repo.get_by_date(datetime.combine(target_date, datetime.min.time()), db_session)  # object
-    assert all(e.datetime.date() == target_date for e in fetched)
+    assert {e.id for e in fetched} == {e.id for e in events_index.by_date[target_date]}
 
 def test_get_by_date_sorted(event_repo, events_fixture, now, db_session):
     target_date = (now + timedelta(days=5)).date()
@@ -137,41 +124,38 @@ def test_get_by_date_sorted(event_repo, events_fixture, now, db_session):
     times = [e.datetime for e in fetched]
     assert times == sorted(times)
 
-def test_get_by_location(event_repo, events_fixture, db_session):
+def test_get_by_location(event_repo, events_fixture, events_index, db_session):
     loc = events_fixture[1].location
     fetched = event_repo.get_by_location(loc, db_session)  # object
-    assert all(e.location == loc for e in fetched)
+    assert {e.id for e in fetched} == {e.id for e in events_index.by_location[loc]}
 
-def test_get_by_category(event_repo, events_fixture, db_session):
+def test_get_by_category(event_repo, events_fixture, events_index, db_session):
     cat = events_fixture[0].category
     fetched = event_repo.get_by_category(cat, db_session)  # object
-    assert all(e.category == cat for e in fetched)
+    assert {e.id for e in fetched} == {e.id for e in events_index.by_category[cat]}
 
 def test_save_event(event_repo, organizer_user, now, db_session):
     dummy_vec = [0.0] * Config.UNIFIED_VECTOR_DIM
-    ev = Event(
+    ev = make_event(
         title="New Test Event",
         datetime=now + timedelta(days=2),
-        description="Test description",
         organizer_id=organizer_user.id,
-        location="Test Location",
-        category="Test Category",
         embedding=dummy_vec,
     )
     saved = event_repo.save(ev, db_session())  # save with session()
-    db_session.commit()
+    db_session.flush()
     assert event_repo.get_by_id(saved.id, db_session) == saved  # query with session object
 
 def test_delete_by_id(event_repo, events_fixture, db_session):
     target = events_fixture[0]
     event_repo.delete_by_id(target.id, db_session)  # object
-    db_session.commit()
+    db_session.flush()
     assert event_repo.get_by_id(target.id, db_session) is None
 
 def test_delete_by_title(event_repo, events_fixture, db_session):
     target = events_fixture[2]
     event_repo.delete_by_title(target.title, db_session)  # object
-    db_session.commit()
+    db_session.flush()
     assert event_repo.get_by_title(target.title, db_session) is None
 
 def test_exists_by_id(event_repo, events_fixture, db_session):
@@ -1,26 +1,16 @@
 # tests/repositories/user_repository_impl_test.py
 import pytest
-from sqlalchemy.orm import scoped_session, sessionmaker
 
-from app import create_app
 from app.extensions import db as _db
 from app.models.user import User
 from app.repositories.user_repository_impl import UserRepositoryImpl
-from tests.util.util_test import test_cfg
 
-
-@pytest.fixture(scope="session")
-def app():
-    app = create_app(test_cfg)
-    with app.app_context():
-        _db.drop_all()
-        _db.create_all()
-        yield app
-        _db.session.remove()
+pytestmark = pytest.mark.slow
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def clean_db(app):
+    """Start the module from empty tables; each test is then isolated by db_session's rollback."""
     with app.app_context():
         for table in reversed(_db.metadata.sorted_tables):
             _db.session.execute(table.delete())
@@ -28,34 +18,33 @@ def clean_db(app):
 
 
 @pytest.fixture
-def db_session(app):
-    connection = _db.engine.connect()
-    transaction = connection.begin()
-    session_factory = sessionmaker(bind=connection)
-    session = scoped_session(session_factory)
-
-    yield session
-
-    session.remove()
-    transaction.rollback()
-    connection.close()
+def user_repo():
+    return UserRepositoryImpl()
 
 
 @pytest.fixture
-def user_repo():
-    return UserRepositoryImpl()
+def seed_users(db_session):
+    """Insert n users with one add_all + flush; the rows are batched into a single INSERT."""
+    def _seed(n: int) -> list[User]:
+        users = [
+            User(name=f"User{i}", surname="Smith", email=f"user{i}@example.com", password="hashed-password")
+            for i in range(n)
+        ]
+        db_session.add_all(users)
+        db_session.flush()
+        return users
 
+    return _seed
 
-def test_get_all_users(user_repo, db_session):
-    u1 = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
-    u2 = User(name="Ana",   surname="Smith", email="ana@example.com",   password="hashed-password123")
 
-    s1 = user_repo.save(u1, db_session())
-    s2 = user_repo.save(u2, db_session())
-    db_session.commit()
+def test_get_all_users(user_repo, db_session, seed_users, query_counter):
+    seeded = seed_users(2)
 
+    before = len(query_counter)
     fetched = user_repo.get_all(db_session())
-    saved_ids = {s1.id, s2.id}
+    # a single SELECT, however many users there are
+    assert len(query_counter) - before == 1
+    saved_ids = {u.id for u in seeded}
     fetched_ids = {u.id for u in fetched}
     assert saved_ids.issubset(fetched_ids)
 
@@ -63,7 +52,7 @@ def test_get_all_users(user_repo, db_session):
 def test_get_by_id(user_repo, db_session):
     u = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
     s = user_repo.save(u, db_session())
-    db_session.commit()
+    db_session.flush()
 
     fetched = user_repo.get_by_id(s.id, db_session)
     assert fetched is not None
@@ -73,7 +62,7 @@ def test_get_by_id(user_repo, db_session):
 def test_get_by_name(user_repo, db_session):
     u = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
     s = user_repo.save(u, db_session())
-    db_session.commit()
+    db_session.flush()
 
     fetched = user_repo.get_by_name("Alice", db_session)
     assert fetched is not None
@@ -83,7 +72,7 @@ def test_get_by_name(user_repo, db_session):
 def test_get_by_email(user_repo, db_session):
     u = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
     s = user_repo.save(u, db_session())
-    db_session.commit()
+    db_session.flush()
 
     fetched = user_repo.get_by_email("alice@example.com", db_session)
     assert fetched is not None
@@ -93,7 +82,7 @@ def test_get_by_email(user_repo, db_session):
 def test_exists_by_id(user_repo, db_session):
     u = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
     s = user_repo.save(u, db_session())
-    db_session.commit()
+    db_session.flush()
 
     assert user_repo.exists_by_id(s.id, db_session) is True
     assert user_repo.exists_by_id(999999, db_session) is False
@@ -102,7 +91,7 @@ def test_exists_by_id(user_repo, db_session):
 def test_exists_by_name(user_repo, db_session):
     u = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
     s = user_repo.save(u, db_session())
-    db_session.commit()
+    db_session.flush()
 
     assert user_repo.exists_by_name(s.name, db_session) is True
     assert user_repo.exists_by_name("Nope", db_session) is False
@@ -111,9 +100,8 @@ def test_exists_by_name(user_repo, db_session):
 def test_delete_user_by_id(user_repo, db_session):
     u = User(name="Alice", surname="Smith", email="alice@example.com", password="hashed-password")
     s = user_repo.save(u, db_session())
-    db_session.commit()
+    db_session.flush()
 
-    user_repo.delete_by_id(s.id, db_session)
-    db_session.commit()
+    user_repo.delete_by_id(s.id, db_session)  # flushes the DELETE itself
 
     assert user_repo.get_by_id(s.id, db_session) is None
@@ -2,20 +2,15 @@ from unittest.mock import MagicMock, ANY
 
 import pytest
 
-from app import create_app
 from app.routes.app_route import ParticipantResource, ListParticipantsResource, PromptResource
 from app.services.app_service import AppService
 from app.services.model.model_service import ModelService
 from app.util.test_jwt_token_util import generate_test_token
-from tests.util.util_test import test_cfg
 
+pytestmark = pytest.mark.slow
 
-@pytest.fixture
-def app():
-    app = create_app(test_cfg)
-    yield app
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_header(app):
     token = generate_test_token(app, user_id=1)
     return {"Authorization": f"Bearer {token}"}
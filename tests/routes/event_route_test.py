@@ -1,48 +1,33 @@
 # tests/routes/test_event_route.py
 
-import os
 import pytest
 import importlib.util
+from collections import Counter
 from datetime import datetime, timedelta
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from app import create_app
 from app.extensions import db as _db
 from app.models.user import User
 from app.models.event import Event
 from app.repositories.event_repository_impl import EventRepositoryImpl
 from app.configuration.config import Config
+from tests.util.factories import make_event
 
 from flask_jwt_extended import create_access_token
 from dependency_injector import providers
 
+pytestmark = pytest.mark.slow
 
-# ----------------- Test Config (real Postgres test DB) -----------------
 
-test_cfg = {
-    "TESTING": True,
-    "SQLALCHEMY_DATABASE_URI": (
-        f"postgresql://{os.getenv('TEST_DB_USER')}:{os.getenv('TEST_DB_PASSWORD')}"
-        f"@{os.getenv('TEST_DB_HOST')}:{os.getenv('TEST_DB_PORT')}/{os.getenv('TEST_DB_NAME')}"
-    ),
-    "JWT_SECRET_KEY": "test-secret-key",
-}
-
-def has_flask_async_support() -> bool:
-    # Flask[async] depends on asgiref; presence is a good proxy
-    return importlib.util.find_spec("asgiref") is not None
+# Flask[async] depends on asgiref; presence is a good proxy.
+# Resolved once at import instead of per skipif decorator.
+HAS_FLASK_ASYNC = importlib.util.find_spec("asgiref") is not None
 
 
 # ----------------- App & DB Fixtures -----------------
 
-@pytest.fixture(scope="session")
-def app():
-    app = create_app(test_cfg)
-    with app.app_context():
-        _db.drop_all()
-        _db.create_all()
-        yield app
-        _db.session.remove()
+# `app` is the shared session-scoped fixture from tests/conftest.py: the schema is built
+# once per run and every test here starts from the tables emptied by clean_db.
 
 @pytest.fixture(autouse=True)
 def clean_db(app):
@@ -68,8 +53,9 @@ def db_session(app):
 def client(app):
     return app.test_client()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_header(app):
+    # Tokens stay valid for an hour, far longer than the module runs, so sign once
     # IMPORTANT: identity must be a STRING for PyJWT (sub claim)
     with app.app_context():
         token = create_access_token(identity="1", additional_claims={"email": "tester@example.com"})
@@ -105,15 +91,7 @@ def seed_events(db_session, organizer_user, now):
     ]
     out = []
     for e in data:
-        ev = Event(
-            title=e["title"],
-            datetime=e["datetime"],
-            description=e["description"],
-            organizer_id=organizer_user.id,
-            location=e["location"],
-            category=e["category"],
-            embedding=dummy_vec,
-        )
+        ev = make_event(**e, organizer_id=organizer_user.id, embedding=dummy_vec)
         saved = repo.save(ev, db_session)
         db_session.commit()
         out.append(saved)
@@ -249,32 +227,34 @@ class FakeEventService:
 
 # ----------------- DI Override + Re-wire (instance-based) -----------------
 
-@pytest.fixture(autouse=True)
-def _override_and_rewire(db_session):
+# Setup counter for the wiring guard test at the bottom of the module
+_WIRE_CALLS = Counter()
+
+@pytest.fixture(scope="module")
+def _wired_container():
+    # Wiring patches every injection point in the module, so do it once per module
     from app.container import Container as AppContainer
     container = AppContainer()
     container.init_resources()
 
-    container.event_service.override(providers.Object(FakeEventService(db_session)))
-    container.user_service.override(providers.Object(FakeUserService(db_session)))
-
     import app.routes.event_route as event_route_module
     container.wire(modules=[event_route_module])
+    _WIRE_CALLS["event_route"] += 1
+
+    yield container
+
+    container.unwire()
+
+@pytest.fixture(autouse=True)
+def _override_services(_wired_container, db_session):
+    _wired_container.event_service.override(providers.Object(FakeEventService(db_session)))
+    _wired_container.user_service.override(providers.Object(FakeUserService(db_session)))
 
     yield
 
-    try:
-        container.unwire()
-    except Exception:
-        pass
-    try:
-        container.event_service.reset_override()
-    except Exception:
-        pass
-    try:
-        container.user_service.reset_override()
-    except Exception:
-        pass
+    # Reset every provider override, not just the two set above, so nothing leaks
+    # into later tests on the same (xdist) worker
+    _wired_container.reset_override()
 
 
 # ----------------- Tests -----------------
@@ -350,7 +330,7 @@ def test_get_by_date_invalid_format(client, auth_header):
 
 # ----- POST (async) -----
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; POST route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; POST route is async")
 def test_post_event_success(client, auth_header, organizer_user):
     payload = {
         "title": "E2",
@@ -367,14 +347,14 @@ def test_post_event_success(client, auth_header, organizer_user):
     assert body["datetime"] == "2025-08-04 16:00:00"
     assert "id" not in body  # keep your API contract
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; POST route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; POST route is async")
 def test_post_event_missing_required_fields_returns_422(client, auth_header):
     res = client.post("/events", json={"title": "X"}, headers=auth_header)
     assert res.status_code == 422
     body = res.get_json()
     assert body is not None
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; POST route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; POST route is async")
 def test_post_event_invalid_datetime_returns_422(client, auth_header, organizer_user):
     payload = {
         "title": "BadDT",
@@ -387,7 +367,7 @@ def test_post_event_invalid_datetime_returns_422(client, auth_header, organizer_
     res = client.post("/events", json=payload, headers=auth_header)
     assert res.status_code == 422
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; POST route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; POST route is async")
 def test_post_event_unknown_organizer_returns_422(client, auth_header):
     payload = {
         "title": "NoOrg",
@@ -402,7 +382,7 @@ def test_post_event_unknown_organizer_returns_422(client, auth_header):
 
 # ----- PUT (async) -----
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; PUT route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; PUT route is async")
 def test_put_update_success(client, auth_header, seed_events):
     payload = {"description": "updated", "location": "Skopje"}
     res = client.put("/events/title/Tech Conference 2025", json=payload, headers=auth_header)
@@ -411,28 +391,33 @@ def test_put_update_success(client, auth_header, seed_events):
     assert body["description"] == "updated"
     assert body["location"] == "Skopje"
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; PUT route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; PUT route is async")
 def test_put_empty_patch_returns_400(client, auth_header):
     res = client.put("/events/title/Anything", json={}, headers=auth_header)
     assert res.status_code == 400
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; PUT route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; PUT route is async")
 def test_put_unknown_fields_returns_400(client, auth_header, seed_events):
     # FIX: The route runs schema.load(partial=True) first; unknown fields are dropped → patch == {}
     # which triggers 400 "No valid update fields provided". Expect 400 (not 422).
     res = client.put("/events/title/Tech Conference 2025", json={"foo": "bar"}, headers=auth_header)
     assert res.status_code == 400
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; PUT route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; PUT route is async")
 def test_put_invalid_datetime_returns_422(client, auth_header, seed_events):
     res = client.put("/events/title/Tech Conference 2025",
                      json={"datetime": "bad-dt"},
                      headers=auth_header)
     assert res.status_code == 422
 
-@pytest.mark.skipif(not has_flask_async_support(), reason="Flask async extra not installed; PUT route is async")
+@pytest.mark.skipif(not HAS_FLASK_ASYNC, reason="Flask async extra not installed; PUT route is async")
 def test_put_not_found_returns_422(client, auth_header):
     res = client.put("/events/title/NoSuch", json={"description": "x"}, headers=auth_header)
     # With current service raising ValidationError for not found, this is 422.
     # If you later map NotFound → 404, update this assertion.
     assert res.status_code == 422
+
+
+def test_zzz_container_wired_once():
+    # Runs last in the module: wiring must not regress to per-test setup
+    assert _WIRE_CALLS["event_route"] == 1
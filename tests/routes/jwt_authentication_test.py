@@ -1,110 +1,94 @@
 # tests/routes/test_events_and_auth_http.py
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 from datetime import datetime
+from types import SimpleNamespace
 from dependency_injector import providers
 from flask_jwt_extended import create_access_token
 
 from app import create_app
-from app.container import Container
+from app.services.event_service import EventService
 from app.extensions import db as _db
 from app.models.user import User
-from app.models.event import Event
 from tests.util.util_test import test_cfg
 
+pytestmark = pytest.mark.slow
 
-@pytest.fixture
+# Any fixed instant works; the route only serializes it
+_FIXED_DT = datetime(2025, 1, 1, 12, 0)
+
+
+@pytest.fixture(scope="module")
 def mock_event_service():
-    svc = MagicMock()
+    # spec'd plain Mock: no magic-method setup, and typos in service calls fail loudly
+    svc = Mock(spec=EventService)
+    # Plain attribute bag: the route only serializes it, no ORM instrumentation needed
     svc.get_all.return_value = [
-        Event(
+        SimpleNamespace(
             id=1,
             title="Test Event",
             description="An event for testing",
-            datetime=datetime.now(),
+            datetime=_FIXED_DT,
             location="Skopje",
             category="Tech",
             organizer_id=1,
+            organizer=None,
+            guests=[],
         )
     ]
-    # First pass (helps when running this file alone)
-    Container.event_service.override(providers.Object(svc))
-    yield svc
-    try:
-        Container.event_service.reset_override()
-    except Exception:
-        pass
-
-@pytest.fixture(autouse=True)
-def _reset_container_between_tests():
-    # Run test
-    yield
-    # HARD reset after every test to avoid cross-module leakage
-    try:
-        Container.unwire()
-    except Exception:
-        pass
-    for p in (
-        getattr(Container, "event_service", None),
-        getattr(Container, "user_service", None),
-        getattr(Container, "embedding_service", None),
-    ):
-        if isinstance(p, providers.Provider):
-            try:
-                p.reset_override()
-            except Exception:
-                pass
-    try:
-        Container.reset_singletons()
-    except Exception:
-        pass
-
-@pytest.fixture(scope="function")
-def app(mock_event_service):
-    # Re-apply override *right here* to beat any earlier wiring from other test modules
-    Container.event_service.override(providers.Object(mock_event_service))
+    return svc
+
 
+@pytest.fixture(scope="module")
+def app():
+    # One app per module: create_app (migrations, DI wiring, API registration) runs once
     app = create_app(test_cfg)
     with app.app_context():
         yield app
 
-    # Teardown: reset override to avoid leaking into other modules
-    try:
-        Container.event_service.reset_override()
-    except Exception:
-        pass
 
+@pytest.fixture(scope="module", autouse=True)
+def _override_event_service(app, mock_event_service):
+    """Point this app's container at the mock for the module; the context manager resets it."""
+    with app.di.event_service.override(providers.Object(mock_event_service)):
+        yield
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="module", autouse=True)
 def clean_db(app):
+    """Start the module from empty tables; no test here writes, so once is enough."""
     with app.app_context():
         for table in reversed(_db.metadata.sorted_tables):
             _db.session.execute(table.delete())
         _db.session.commit()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
     return app.test_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_header(app):
     with app.app_context():
         token = create_access_token(identity="1", fresh=True)
         return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
-def test_user_record(app):
+@pytest.fixture(scope="module")
+def test_user_record(app, clean_db):
+    """One committed user for the login tests, which only read it; removed after the module."""
     with app.app_context():
         user = User(name="Test", surname="User", email="test@example.com", password="testpass")
         _db.session.add(user)
         _db.session.commit()
         _db.session.refresh(user)
         _db.session.expunge(user)
-        return user
+    yield user
+    with app.app_context():
+        _db.session.execute(User.__table__.delete().where(User.id == user.id))
+        _db.session.commit()
 
 
 def test_get_all_events_authorized(client, auth_header):
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import Mock
 
 import pytest
 from flask import Flask
@@ -15,11 +15,18 @@ from app.routes.user_route import (
     ExistsByIdResource,
     ExistsByNameResource
 )
-from app.routes.user_route import user_schema, users_schema
+from app.routes.user_route import user_schema
 from app.util.test_jwt_token_util import generate_test_token
 from app.services.user_service import UserService
 from app.extensions import jwt
-from app import create_app
+
+# Built once at import: User(password=...) runs the password hasher. The resources only
+# dump these, so sharing them across tests is safe.
+JOHN = User(id=1, name='John', surname='Doe', email='john@example.com', password='Password1')
+JANE = User(id=2, name='Jane', surname='Smith', email='jane@example.com', password='Password1')
+ALICE = User(id=3, name='Alice', surname='Wolf', email='alice@example.com', password='Password1')
+# Expected response bodies, keyed by user id
+DUMPED = {u.id: user_schema.dump(u) for u in (JOHN, JANE, ALICE)}
 
 @pytest.fixture(scope="session")
 def app():
@@ -33,53 +40,62 @@ def app():
     with app.app_context():
         yield app
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_header(app):
     token = generate_test_token(app, user_id=1)
     return {"Authorization": f"Bearer {token}"}
 
 @pytest.fixture
-def user_service_mock():
-    return MagicMock(spec=UserService)
+def req_ctx(app, auth_header):
+    """Authenticated request context for resource calls that read no request body."""
+    with app.test_request_context(headers=auth_header):
+        yield
+
+@pytest.fixture(scope="module")
+def _user_service_mock():
+    # Plain Mock: the resources never use magic methods; spec_set catches calls the
+    # service interface doesn't define
+    return Mock(spec_set=UserService)
+
+@pytest.fixture
+def user_service_mock(_user_service_mock):
+    """The module's service mock, with calls and stubbed behavior from earlier tests cleared."""
+    _user_service_mock.reset_mock(return_value=True, side_effect=True)
+    return _user_service_mock
 
-def test_get_all_users_empty(app, user_service_mock, auth_header):
+def test_get_all_users_empty(user_service_mock, req_ctx):
     # Service returns empty list
     user_service_mock.get_all.return_value = []
-    with app.test_request_context(headers=auth_header):
-        resource = UserBaseResource()
-        result, status = resource.get(user_service=user_service_mock)
+    resource = UserBaseResource()
+    result, status = resource.get(user_service=user_service_mock)
     assert status == 200
     assert result == []
     user_service_mock.get_all.assert_called_once() # checks that get_all() is called exactly once
 
-def test_get_all_users_nonempty(app, user_service_mock, auth_header):
-    # Prepare two users
-    u1 = User(id=1, name='John', surname='Doe', email='john@example.com', password='secret')
-    u2 = User(id=2, name='Jane', surname='Smith', email='jane@example.com', password='hunter2')
-    user_service_mock.get_all.return_value = [u1, u2]
-    with app.test_request_context(headers=auth_header):
-        resource = UserBaseResource()
-        result, status = resource.get(user_service=user_service_mock)
+def test_get_all_users_nonempty(user_service_mock, req_ctx):
+    user_service_mock.get_all.return_value = [JOHN, JANE]
+    resource = UserBaseResource()
+    result, status = resource.get(user_service=user_service_mock)
     assert status == 200
     # Verify serialization
-    assert result == users_schema.dump([u1, u2])
+    assert result == [DUMPED[JOHN.id], DUMPED[JANE.id]]
     user_service_mock.get_all.assert_called_once()
 
 def test_post_user_success(app, user_service_mock, auth_header):
     input_data = {
         'name': 'Alice',
-        'surname': 'Wonder',
+        'surname': 'Wolf',
         'email': 'alice@example.com',
         'password': 'Password1'
     }
     # The service.save receives a User instance and returns one with an id
-    saved = User(id=3, name='Alice', surname='Wonder', email='alice@example.com', password='Password1')
+    saved = ALICE
     user_service_mock.save.return_value = saved
     with app.test_request_context(json=input_data, headers=auth_header):
         resource = UserBaseResource()
         response, status = resource.post(user_service=user_service_mock)
     assert status == 201
-    assert response == user_schema.dump(saved)
+    assert response == DUMPED[saved.id]
     user_service_mock.save.assert_called_once()
 
 @pytest.mark.parametrize("missing_field", ["name", "surname", "email", "password"])
@@ -98,105 +114,93 @@ def test_post_user_validation_error(app, user_service_mock, missing_field, auth_
             resource.post(user_service=user_service_mock)
 
 @pytest.mark.parametrize("user_id, exists", [(1, True), (2, False)])
-def test_exists_by_id(app, user_service_mock, user_id, exists, auth_header):
+def test_exists_by_id(user_service_mock, user_id, exists, req_ctx):
     user_service_mock.exists_by_id.return_value = exists
-    with app.test_request_context(headers=auth_header):
-        resource = ExistsByIdResource()
-        response, status = resource.get(user_id=user_id, user_service=user_service_mock)
+    resource = ExistsByIdResource()
+    response, status = resource.get(user_id=user_id, user_service=user_service_mock)
     assert status == 200
     assert response == {'exists': exists}
     user_service_mock.exists_by_id.assert_called_once_with(user_id)
 
 @pytest.mark.parametrize("name, exists", [('Alice', True), ('Nemo', False)])
-def test_exists_by_name(app, user_service_mock, name, exists, auth_header):
+def test_exists_by_name(user_service_mock, name, exists, req_ctx):
     user_service_mock.exists_by_name.return_value = exists
-    with app.test_request_context(headers=auth_header):
-        resource = ExistsByNameResource()
-        response, status = resource.get(name=name, user_service=user_service_mock)
+    resource = ExistsByNameResource()
+    response, status = resource.get(name=name, user_service=user_service_mock)
     assert status == 200
     assert response == {'exists': exists}
     user_service_mock.exists_by_name.assert_called_once_with(name)
 
-@pytest.mark.parametrize("user_id, found", [(1, True), (99, False)])
-def test_get_by_id(app, user_service_mock, user_id, found, auth_header):
-    with app.test_request_context(headers=auth_header):
-        resource = UserByIdResource()
+@pytest.mark.parametrize("user_id, user", [(1, JOHN), (99, None)])
+def test_get_by_id(user_service_mock, user_id, user, req_ctx):
+    resource = UserByIdResource()
 
-        if found:
-            user = User(id=user_id, name='Test', surname='User', email='test@example.com', password='X')
-            user_service_mock.get_by_id.return_value = user
+    if user is not None:
+        user_service_mock.get_by_id.return_value = user
 
-            response, status = resource.get(user_id=user_id, user_service=user_service_mock)
+        response, status = resource.get(user_id=user_id, user_service=user_service_mock)
 
-            assert status == 200
-            assert response == user_schema.dump(user)
-            user_service_mock.get_by_id.assert_called_once_with(user_id)
-        else:
-            user_service_mock.get_by_id.side_effect = UserNotFoundException(f"User {user_id} not found")
+        assert status == 200
+        assert response == DUMPED[user.id]
+        user_service_mock.get_by_id.assert_called_once_with(user_id)
+    else:
+        user_service_mock.get_by_id.side_effect = UserNotFoundException(f"User {user_id} not found")
 
-            with pytest.raises(UserNotFoundException):
-                resource.get(user_id=user_id, user_service=user_service_mock)
+        with pytest.raises(UserNotFoundException):
+            resource.get(user_id=user_id, user_service=user_service_mock)
 
-            user_service_mock.get_by_id.assert_called_once_with(user_id)
-
-import pytest
-from app.error_handler.exceptions import UserNotFoundException
-from app.models.user import User
-from app.routes.user_route import UserByIdResource  # adjust import if needed
+        user_service_mock.get_by_id.assert_called_once_with(user_id)
 
 @pytest.mark.parametrize("user_id, found", [(1, True), (5, False)])
-def test_delete_by_id(app, user_service_mock, user_id, found, auth_header):
-    with app.test_request_context(headers=auth_header):
-        resource = UserByIdResource()
+def test_delete_by_id(user_service_mock, user_id, found, req_ctx):
+    resource = UserByIdResource()
 
-        if found:
-            # Success path: delete succeeds (no return value)
-            user_service_mock.delete_by_id.return_value = None
+    if found:
+        # Success path: delete succeeds (no return value)
+        user_service_mock.delete_by_id.return_value = None
 
-            body, status = resource.delete(user_id=user_id, user_service=user_service_mock)
+        body, status = resource.delete(user_id=user_id, user_service=user_service_mock)
 
-            assert status == 204
-            assert body == ""
-            user_service_mock.delete_by_id.assert_called_once_with(user_id)
-            user_service_mock.get_by_id.assert_not_called()
+        assert status == 204
+        assert body == ""
+        user_service_mock.delete_by_id.assert_called_once_with(user_id)
+        user_service_mock.get_by_id.assert_not_called()
 
-        else:
-            # Not-found path: route calls delete_by_id which raises
-            user_service_mock.delete_by_id.side_effect = UserNotFoundException(f"User {user_id} not found")
+    else:
+        # Not-found path: route calls delete_by_id which raises
+        user_service_mock.delete_by_id.side_effect = UserNotFoundException(f"User {user_id} not found")
 
-            with pytest.raises(UserNotFoundException):
-                resource.delete(user_id=user_id, user_service=user_service_mock)
+        with pytest.raises(UserNotFoundException):
+            resource.delete(user_id=user_id, user_service=user_service_mock)
 
-            user_service_mock.delete_by_id.assert_called_once_with(user_id)
-            user_service_mock.get_by_id.assert_not_called()
+        user_service_mock.delete_by_id.assert_called_once_with(user_id)
+        user_service_mock.get_by_id.assert_not_called()
 
 
-@pytest.mark.parametrize("email, found", [('john@example.com', True), ('foo@bar.com', False)])
-def test_get_by_email(app, user_service_mock, email, found, auth_header):
-    with app.test_request_context(headers=auth_header):
-        resource = UserByEmailResource()
+@pytest.mark.parametrize("email, user", [('john@example.com', JOHN), ('foo@bar.com', None)])
+def test_get_by_email(user_service_mock, email, user, req_ctx):
+    resource = UserByEmailResource()
 
-        if found:
-            user = User(id=7, name='J', surname='D', email=email, password='X')
-            user_service_mock.get_by_email.return_value = user
+    if user is not None:
+        user_service_mock.get_by_email.return_value = user
 
-            response, status = resource.get(email=email, user_service=user_service_mock)
+        response, status = resource.get(email=email, user_service=user_service_mock)
 
-            assert status == 200
-            assert response == user_schema.dump(user)
-            user_service_mock.get_by_email.assert_called_once_with(email)
-        else:
-            user_service_mock.get_by_email.side_effect = UserNotFoundException(f"User {email} not found")
+        assert status == 200
+        assert response == DUMPED[user.id]
+        user_service_mock.get_by_email.assert_called_once_with(email)
+    else:
+        user_service_mock.get_by_email.side_effect = UserNotFoundException(f"User {email} not found")
 
-            with pytest.raises(UserNotFoundException):
-                resource.get(email=email, user_service=user_service_mock)
+        with pytest.raises(UserNotFoundException):
+            resource.get(email=email, user_service=user_service_mock)
 
-            user_service_mock.get_by_email.assert_called_once_with(email)
+        user_service_mock.get_by_email.assert_called_once_with(email)
 
 def test_put_user_partial_update_success(app, user_service_mock, auth_header):
     email = "alice@example.com"
     payload = {"surname": "Wolf"}  # partial update allowed by partial=True
-    updated = User(id=3, name="Alice", surname="Wolf", email=email, password="X")
+    updated = ALICE
 
     user_service_mock.update.return_value = updated
 
@@ -205,7 +209,7 @@ def test_put_user_partial_update_success(app, user_service_mock, auth_header):
         response, status = resource.put(email=email, user_service=user_service_mock)
 
     assert status == 200
-    assert response == user_schema.dump(updated)
+    assert response == DUMPED[updated.id]
     user_service_mock.update.assert_called_once_with(email, payload)
 
 
@@ -236,24 +240,22 @@ def test_put_user_not_found(app, user_service_mock, auth_header):
 
     user_service_mock.update.assert_called_once_with(email, payload)
 
-@pytest.mark.parametrize("name, found", [('Alice', True), ('Bob', False)])
-def test_get_by_name(app, user_service_mock, name, found, auth_header):
-    with app.test_request_context(headers=auth_header):
-        resource = UsersByNameResource()
+@pytest.mark.parametrize("name, user", [('Alice', ALICE), ('Bob', None)])
+def test_get_by_name(user_service_mock, name, user, req_ctx):
+    resource = UsersByNameResource()
 
-        if found:
-            user = User(id=10, name=name, surname='X', email='x@y.com', password='X')
-            user_service_mock.get_by_name.return_value = user
+    if user is not None:
+        user_service_mock.get_by_name.return_value = user
 
-            response, status = resource.get(name=name, user_service=user_service_mock)
+        response, status = resource.get(name=name, user_service=user_service_mock)
 
-            assert status == 200
-            assert response == user_schema.dump(user)
-            user_service_mock.get_by_name.assert_called_once_with(name)
-        else:
-            user_service_mock.get_by_name.side_effect = UserNotFoundException(f"User {name} not found")
+        assert status == 200
+        assert response == DUMPED[user.id]
+        user_service_mock.get_by_name.assert_called_once_with(name)
+    else:
+        user_service_mock.get_by_name.side_effect = UserNotFoundException(f"User {name} not found")
 
-            with pytest.raises(UserNotFoundException):
-                resource.get(name=name, user_service=user_service_mock)
+        with pytest.raises(UserNotFoundException):
+            resource.get(name=name, user_service=user_service_mock)
 
-            user_service_mock.get_by_name.assert_called_once_with(name)
+        user_service_mock.get_by_name.assert_called_once_with(name)
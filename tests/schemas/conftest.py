@@ -0,0 +1,24 @@
+import pytest
+
+from app.schemas.event_schema import CREATE_EVENT_SCHEMA, EVENT_SCHEMA
+from app.schemas.user_schema import CreateUserSchema, UserSchema
+
+
+@pytest.fixture(scope="session")
+def create_schema():
+    return CREATE_EVENT_SCHEMA
+
+
+@pytest.fixture(scope="session")
+def event_schema():
+    return EVENT_SCHEMA
+
+
+@pytest.fixture(scope="session")
+def create_user_schema():
+    return CreateUserSchema()
+
+
+@pytest.fixture(scope="session")
+def user_schema():
+    return UserSchema()
@@ -1,28 +1,29 @@
 import pytest
+from types import MappingProxyType
 from marshmallow import ValidationError
 from app.models.user import User
 
-# 1. Import your schemas
-from app.schemas.event_schema import CreateEventSchema, EventSchema
+# Event factory
+from tests.util.factories import EVENT_FIELDS, make_event
 
-# 2. Import your model
-from app.models.event import Event
+RAW_PAYLOAD = {
+    "title": "  Rock music event  ",
+    "location": "  Beertija Pub, Skopje ",
+    "description": " 20% discount on every beer between 8:00-900PM.    ",
+    "category": "Rock",
+    "datetime": "2025-07-31 20:30:00",
+    "organizer_email": "bob@example.com",
+}
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def raw_payload():
-    return {
-        "title": "  Rock music event  ",
-        "location": "  Beertija Pub, Skopje ",
-        "description": " 20% discount on every beer between 8:00-900PM.    ",
-        "category": "Rock",
-        "datetime": "2025-07-31 20:30:00",
-        "organizer_email": "bob@example.com",
-    }
+    # Shared and read-only: pre_load strips strings in place, so tests load from a copy
+    return MappingProxyType(RAW_PAYLOAD)
 
 # Roundtrip: DTO -> Entity -> DTO
-def test_dto_to_entity_to_dto_roundtrip(raw_payload):
+def test_dto_to_entity_to_dto_roundtrip(raw_payload, create_schema, event_schema):
     # 1) LOAD: Validate & normalize incoming data
-    loaded = CreateEventSchema().load(raw_payload)
+    loaded = create_schema.load(dict(raw_payload))
 
     # verify organizer_email is present in loaded data
     assert loaded["organizer_email"] == raw_payload["organizer_email"]
@@ -34,19 +35,15 @@ def test_dto_to_entity_to_dto_roundtrip(raw_payload):
         for i in range(3)
     ]
     # 3) DTO -> Entity: attach dummy organizer_id and build Event
-    event = Event(
-        title=loaded["title"],
-        location=loaded["location"],
-        description=loaded["description"],
-        category=loaded["category"],
-        datetime=loaded["datetime"],
+    event = make_event(
+        **{k: loaded[k] for k in EVENT_FIELDS},
         organizer=organizer,
         organizer_id=organizer.id,
     )
     event.guests = guests
 
     # 4) DUMP: serialize back to dict
-    dumped = EventSchema().dump(event)
+    dumped = event_schema.dump(event)
 
     # 5) ASSERTIONS: loaded values trimmed and normalized
     assert loaded["title"] == "Rock music event"
@@ -73,7 +70,7 @@ def test_dto_to_entity_to_dto_roundtrip(raw_payload):
     }
 
 
-def test_invalid_datetime_format():
+def test_invalid_datetime_format(create_schema):
     bad = {
         "title": "Rock music event",
         "location": "Beertija Pub, Skopje",
@@ -83,4 +80,4 @@ def test_invalid_datetime_format():
         "organizer_email": "bob@example.com",
     }
     with pytest.raises(ValidationError):
-        CreateEventSchema().load(bad)
+        create_schema.load(bad)
@@ -1,13 +1,10 @@
 import pytest
 from marshmallow import ValidationError
 
-# 1. Import your schemas
-from app.schemas.user_schema import CreateUserSchema, UserSchema
-
-# 2. Import your model/
+# Import your model/
 from app.models.user import User
 
-# 3. A dummy hash function (replace with your real one or mock)
+# A dummy hash function (replace with your real one or mock)
 def dummy_hash(raw):
     return f"hashed-{raw}"
 
@@ -20,9 +17,9 @@ def raw_payload():
         "password": "Secr3tPass"
     }
 
-def test_dto_to_entity_to_dto_roundtrip(raw_payload):
+def test_dto_to_entity_to_dto_roundtrip(raw_payload, create_user_schema, user_schema):
     # 1) LOAD: Validate & normalize incoming data
-    loaded = CreateUserSchema().load(raw_payload)
+    loaded = create_user_schema.load(raw_payload)
 
     # 2) MODEL: Instantiate your User entity (hashing password)
     user = User(
@@ -34,7 +31,7 @@ def test_dto_to_entity_to_dto_roundtrip(raw_payload):
     # (You could also attach user.id here if you want to test dump_only)
 
     # 3) DUMP: Serialize back to JSON-safe dict
-    dumped = UserSchema().dump(user)
+    dumped = user_schema.dump(user)
 
     # 4) ASSERTIONS:
     #   - All leading/trailing whitespace removed
@@ -47,7 +44,7 @@ def test_dto_to_entity_to_dto_roundtrip(raw_payload):
     #   - The fields you expect are present
     assert set(dumped.keys()) == {"name", "surname", "email"}
 
-def test_invalid_password_rejected():
+def test_invalid_password_rejected(create_user_schema):
     bad = {
         "name": "Bob",
         "surname": "Jones",
@@ -55,4 +52,4 @@ def test_invalid_password_rejected():
         "password": "weak"  # too short / missing uppercase or digit
     }
     with pytest.raises(ValidationError):
-        CreateUserSchema().load(bad)
+        create_user_schema.load(bad)
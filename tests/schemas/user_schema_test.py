@@ -2,22 +2,27 @@
 import pytest
 from marshmallow import ValidationError
 
-from app.schemas.user_schema import (
-    CreateUserSchema,
-    UserSchema,
-)
+VALID_PAYLOAD = {
+    "name": "  Alice  ",
+    "surname": "  Smith ",
+    "email": "  Alice.Smith@Example.COM  ",
+    "password": "Secr3tPass"
+}
+
+# Parametrized payloads built once at import; tests load a copy because pre_load
+# strips and lowercases in place
+MISSING_FIELD_PAYLOADS = {
+    field: {k: v for k, v in VALID_PAYLOAD.items() if k != field}
+    for field in ["name", "surname", "email", "password"]
+}
+BLANK_FIELD_PAYLOADS = {field: {**VALID_PAYLOAD, field: "   "} for field in ["name", "surname"]}
 
 @pytest.fixture
 def valid_payload():
-    return {
-        "name": "  Alice  ",
-        "surname": "  Smith ",
-        "email": "  Alice.Smith@Example.COM  ",
-        "password": "Secr3tPass"
-    }
+    return dict(VALID_PAYLOAD)
 
-def test_create_user_schema_loads_and_normalizes(valid_payload):
-    data = CreateUserSchema().load(valid_payload)
+def test_create_user_schema_loads_and_normalizes(valid_payload, create_user_schema):
+    data = create_user_schema.load(valid_payload)
     # leading/trailing whitespace stripped
     assert data["name"] == "Alice"
     assert data["surname"] == "Smith"
@@ -26,26 +31,25 @@ def test_create_user_schema_loads_and_normalizes(valid_payload):
     # password stays as given (to be hashed later)
     assert data["password"] == valid_payload["password"]
 
-def test_create_user_schema_rejects_short_password(valid_payload):
+def test_create_user_schema_rejects_short_password(valid_payload, create_user_schema):
     payload = dict(valid_payload, password="Short1")
-    with pytest.raises(ValidationError) as ei:
-        CreateUserSchema().load(payload)
     # should mention minimum length
-    assert "Password must be at least" in str(ei.value)
+    with pytest.raises(ValidationError, match="Password must be at least"):
+        create_user_schema.load(payload)
 
-def test_create_user_schema_rejects_password_without_upper_or_digit(valid_payload):
-    for bad in ["alllowercase1", "ALLUPPERCASE", "NoDigitsHere"]:
-        payload = dict(valid_payload, password=bad)
-        with pytest.raises(ValidationError):
-            CreateUserSchema().load(payload)
+@pytest.mark.parametrize("bad", ["alllowercase1", "ALLUPPERCASE", "NoDigitsHere"])
+def test_create_user_schema_rejects_password_without_upper_or_digit(valid_payload, create_user_schema, bad):
+    payload = dict(valid_payload, password=bad)
+    with pytest.raises(ValidationError):
+        create_user_schema.load(payload)
 
-def test_create_user_schema_rejects_extra_fields(valid_payload):
+def test_create_user_schema_rejects_extra_fields(valid_payload, create_user_schema):
     payload = dict(valid_payload, foo="bar")
-    data = CreateUserSchema().load(payload)
+    data = create_user_schema.load(payload)
     # unknown fields are dropped
     assert "foo" not in data
 
-def test_user_schema_dumps_only_public_fields():
+def test_user_schema_dumps_only_public_fields(user_schema):
     # simulate a User-like object or dict
     user_obj = {
         "id": 123,
@@ -55,31 +59,28 @@ def test_user_schema_dumps_only_public_fields():
         "password": "secret",            # shouldn't appear
         "created_at": "bogus",           # dropped by unknown=EXCLUDE
     }
-    dumped = UserSchema().dump(user_obj)
+    dumped = user_schema.dump(user_obj)
     assert dumped == {
         "name": "Bob",
         "surname": "Jones",
         "email": "bob@example.com",
     }
 
-@pytest.mark.parametrize("field", ["name","surname","email","password"])
-def test_create_user_schema_requires_fields(valid_payload, field):
-    payload = dict(valid_payload)
-    del payload[field]
+@pytest.mark.parametrize("field", list(MISSING_FIELD_PAYLOADS))
+def test_create_user_schema_requires_fields(field, create_user_schema):
     with pytest.raises(ValidationError) as exc:
-        CreateUserSchema().load(payload)
+        create_user_schema.load(dict(MISSING_FIELD_PAYLOADS[field]))
     assert field in exc.value.messages
 
-@pytest.mark.parametrize("field", ["name","surname"])
-def test_rejects_blank_only_strings(valid_payload, field):
-    bad = dict(valid_payload, **{field: "   "})
+@pytest.mark.parametrize("field", list(BLANK_FIELD_PAYLOADS))
+def test_rejects_blank_only_strings(field, create_user_schema):
     with pytest.raises(ValidationError) as exc:
-        CreateUserSchema().load(bad)
+        create_user_schema.load(dict(BLANK_FIELD_PAYLOADS[field]))
     assert field in exc.value.messages
 
-def test_invalid_email_format(valid_payload):
+def test_invalid_email_format(valid_payload, create_user_schema):
     bad = dict(valid_payload, email="not-an-email")
     with pytest.raises(ValidationError) as exc:
-        CreateUserSchema().load(bad)
+        create_user_schema.load(bad)
     assert "email" in exc.value.messages
 
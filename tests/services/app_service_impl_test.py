@@ -3,8 +3,6 @@ from sqlalchemy.exc import IntegrityError
 from psycopg2.errors import UniqueViolation
 
 import pytest
-from unittest.mock import MagicMock
-from sqlalchemy.orm import Session
 
 from app.error_handler.exceptions import (
     UserAlreadyInEventException,
@@ -38,43 +36,13 @@ class DummyEvent:
 
 # ——— Fixtures ——————————————————————————————————————————————
 
-@pytest.fixture
-def fake_session():
-    s = MagicMock(spec=Session)
-    s.commit = MagicMock()
-    s.rollback = MagicMock()
-    # optional: some code hits session.no_autoflush
-    class _NoAutoflush:
-        def __enter__(self): return None
-        def __exit__(self, *args): return False
-    s.no_autoflush = _NoAutoflush()
-    return s
-
-@pytest.fixture
-def patch_db_session(fake_session, monkeypatch):
-    from app import extensions as _ext
-    # make db.session a callable that returns the same fake_session
-    session_factory = MagicMock()
-    session_factory.return_value = fake_session
-    monkeypatch.setattr(_ext.db, "session", session_factory)
-    return fake_session
-
-
-@pytest.fixture
-def mock_user_repo():
-    return MagicMock()
-
-@pytest.fixture
-def mock_event_repo():
-    return MagicMock()
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service(mock_user_repo, mock_event_repo):
+    # The service only holds references to the shared mocks, so one instance per module is enough.
     from app.services.app_service_impl import AppServiceImpl
     return AppServiceImpl(user_repo=mock_user_repo, event_repo=mock_event_repo)
 
 
-
 # ——— Tests ——————————————————————————————————————————————
 
 def test_add_participant_success(service, mock_user_repo, mock_event_repo, patch_db_session):
@@ -16,6 +16,31 @@ def _max_k():
 
 # -------- Provider/env wiring (one place only) --------------------------------
 
+_MISSING = object()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _config_defaults(request):
+    """
+    Make the extractor deterministic across providers.
+    The options never vary per test, so set them once for this module and restore them
+    when it finishes.
+    """
+    original = getattr(Config, "OPENAI_EXTRACT_K_OPTS", _MISSING)
+    Config.OPENAI_EXTRACT_K_OPTS = {
+        "temperature": 0, "top_p": 1, "frequency_penalty": 0,
+        "presence_penalty": 0, "max_tokens": 6, "stream": False,
+    }
+
+    def _restore():
+        if original is _MISSING:
+            del Config.OPENAI_EXTRACT_K_OPTS
+        else:
+            Config.OPENAI_EXTRACT_K_OPTS = original
+
+    request.addfinalizer(_restore)
+
+
 @pytest.fixture
 def provider_env(monkeypatch, request):
     """
@@ -61,14 +86,6 @@ def provider_env(monkeypatch, request):
         monkeypatch.setenv("OPENAI_EMBEDDING_MODEL", os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-large"))
         # If you use a custom OpenAI-compatible base_url in cloud, set OPENAI_BASE_URL and make your Container read it.
 
-    # Make extractor deterministic across providers
-    monkeypatch.setattr(
-        "app.configuration.config.Config.OPENAI_EXTRACT_K_OPTS",
-        {"temperature": 0, "top_p": 1, "frequency_penalty": 0,
-         "presence_penalty": 0, "max_tokens": 6, "stream": False},
-        raising=False,
-    )
-
     # Return the provider to pair with fixtures that depend on it
     return provider
 
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.extensions import db
+from app.repositories.event_repository import EventRepository
+from app.repositories.user_repository import UserRepository
+
+
+def _make_fake_session() -> MagicMock:
+    """
+    Build a Session-like MagicMock that works with the transactional util.
+    Only the session itself needs magic methods (``with session.begin():``).
+    """
+    s = MagicMock(spec=Session)
+    s.commit = Mock()
+    s.rollback = Mock()
+    s.flush = Mock()
+    s.close = Mock()
+    s.remove = Mock()
+    s.in_transaction = Mock(return_value=False)
+
+    class _NoAutoflush:
+        def __enter__(self): return None
+        def __exit__(self, *a): return False
+
+    s.no_autoflush = _NoAutoflush()
+    return s
+
+
+@pytest.fixture(scope="module")
+def _patched_db_session():
+    """
+    Make db.session a **callable** factory (db.session()) that returns the same
+    fake session for the whole module. This matches the services' transactional use.
+    The patch is installed once per module and undone after it, so DB-backed tests
+    collected later see the real session again. app.extensions.db is the instance
+    every module imports.
+    """
+    fake_session = _make_fake_session()
+    session_factory = Mock(name="session_factory", return_value=fake_session)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(db, "session", session_factory)
+        yield fake_session
+
+
+@pytest.fixture
+def patch_db_session(_patched_db_session):
+    """The module's fake session, with the calls recorded by earlier tests cleared."""
+    _patched_db_session.reset_mock()
+    return _patched_db_session
+
+
+# The repository mocks are shared by every service test module; _reset_repo_mocks clears
+# them after every test (return values and side effects included), so no state crosses
+# test or module boundaries.
+
+@pytest.fixture(scope="session")
+def mock_user_repo():
+    # spec_set: plain Mock without magic-method setup, and calls to methods the
+    # repository interface does not define fail instead of silently returning mocks
+    return Mock(spec_set=UserRepository)
+
+
+@pytest.fixture(scope="session")
+def mock_event_repo():
+    return Mock(spec_set=EventRepository)
+
+
+@pytest.fixture(autouse=True)
+def _reset_repo_mocks(mock_user_repo, mock_event_repo):
+    """Clear recorded calls and configured behavior on the shared repo mocks after each test."""
+    yield
+    for m in (mock_user_repo, mock_event_repo):
+        m.reset_mock(return_value=True, side_effect=True)
@@ -1,22 +1,29 @@
 import pytest
 import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
 from app.container import Container
 from app.configuration.config import Config
 from app.error_handler.exceptions import EmbeddingServiceException
+from app.services.embedding_service.embedding_service_impl import EmbeddingServiceImpl
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def embedding_service():
+    # Built once: the provider client (and, for the local provider, its model) is reused
+    # by every live test in the module
     c = Container()
     return c.embedding_service()
 
 
+@pytest.mark.integration
 def test_embedding_single_text_dimension(embedding_service):
     vec = asyncio.run(embedding_service.create_embedding("dimension check"))
     assert isinstance(vec, list)
     assert len(vec) == Config.UNIFIED_VECTOR_DIM
 
 
+@pytest.mark.integration
 @pytest.mark.parametrize("txt", ["hello world", "quick brown fox", "Skopje tech events"])
 def test_embedding_multiple_texts_dimension(embedding_service, txt):
     vec = asyncio.run(embedding_service.create_embedding(txt))
@@ -24,6 +31,20 @@ def test_embedding_multiple_texts_dimension(embedding_service, txt):
     assert len(vec) == Config.UNIFIED_VECTOR_DIM
 
 
-def test_embedding_rejects_empty_input(embedding_service):
+# Guard-clause checks never reach the provider, so they build the service directly
+# instead of going through the DI container.
+
+def test_embedding_rejects_empty_input():
+    service = EmbeddingServiceImpl(client=MagicMock(), model="test-model")
     with pytest.raises(EmbeddingServiceException):
-        asyncio.run(embedding_service.create_embedding("   "))
+        asyncio.run(service.create_embedding("   "))
+
+
+def test_embedding_rejects_mismatched_dimension():
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(
+        return_value=SimpleNamespace(data=[SimpleNamespace(embedding=[0.1, 0.2])])
+    )
+    service = EmbeddingServiceImpl(client=client, model="test-model")
+    with pytest.raises(EmbeddingServiceException, match="dim embedding"):
+        asyncio.run(service.create_embedding("dimension check"))
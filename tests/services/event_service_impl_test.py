@@ -5,110 +5,65 @@ These tests mock the repositories and embedding service to verify business logic
 in isolation, including proper exception handling and delegation of operations.
 """
 
+import re
+
 import pytest
-from unittest.mock import MagicMock, AsyncMock, ANY
+from unittest.mock import Mock, ANY, call, sentinel
 from datetime import datetime
+from types import MappingProxyType
 
-from flask import Flask
-from sqlalchemy.orm import Session
-
-from app.models.event import Event
 from app.models.user import User
+from app.services.embedding_service.embedding_service import EmbeddingService
 from app.services.event_service_impl import EventServiceImpl
 from app.error_handler.exceptions import (
+    EventAlreadyExistsException,
     EventNotFoundException,
     EventDeleteException,
     UserNotFoundException,
 )
-from app.extensions import db
-
-
-# -------------------------------
-# Fixtures
-# -------------------------------
-
-@pytest.fixture(scope="session")
-def app():
-    """
-    Minimal Flask app for unit tests.
-    In-memory SQLite, no create_app().
-    """
-    app = Flask(__name__)
-    app.config.update(
-        TESTING=True,
-        SQLALCHEMY_DATABASE_URI="sqlite:///:memory:",
-        SQLALCHEMY_TRACK_MODIFICATIONS=False,
-    )
-
-    db.init_app(app)
-
-    with app.app_context():
-        # Import models so create_all() knows what to create
-        from app.models.user import User   # noqa: F401
-        from app.models.event import Event # noqa: F401
-
-        db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
-
-
-def _make_fake_session() -> MagicMock:
-    """Build a Session-like MagicMock that works with the transactional util."""
-    s = MagicMock(spec=Session)
-    s.commit = MagicMock()
-    s.rollback = MagicMock()
-    s.flush = MagicMock()
-    s.close = MagicMock()
-    s.remove = MagicMock()
-    s.in_transaction = MagicMock(return_value=False)
-
-    class _NoAutoflush:
-        def __enter__(self): return None
-        def __exit__(self, *a): return False
-
-    s.no_autoflush = _NoAutoflush()
-    return s
-
-
-@pytest.fixture
-def patch_db_session(monkeypatch):
-    """
-    Make db.session a **callable** factory (db.session()) that returns the same
-    fake session for the whole test. This matches the service's transactional use.
-    """
-    fake_session = _make_fake_session()
-    session_factory = MagicMock(name="session_factory", return_value=fake_session)
+from app.util.format_event_util import format_event
+from tests.util.assertions import assert_called_once_each
+from tests.util.factories import make_event
+from tests.util.stubs import StubRepo, echo_saved
 
-    # Patch the *attribute* on the extensions module so anyone importing from there gets it.
-    from app import extensions as _ext
-    monkeypatch.setattr(_ext.db, "session", session_factory)
-    # Also patch the imported symbol in this module (defensive; some code imports `db` directly)
-    monkeypatch.setattr(db, "session", session_factory)
+# Tests only compare stubbed events by identity/equality, never against the clock
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-    return fake_session
+# Read-only create() payload; tests take copies via make_payload
+BASE_PAYLOAD = MappingProxyType({
+    'title':           'Event 1',
+    'description':     'Event description',
+    'datetime':        FROZEN_NOW,
+    'location':        'Location 1',
+    'category':        'category',
+    'organizer_email': 'email@example.com',
+})
 
+# The stored "Event 1" that lookups return: the payload's fields minus the organizer email
+EVENT_1_FIELDS = {k: v for k, v in BASE_PAYLOAD.items() if k != "organizer_email"}
 
-@pytest.fixture
-def mock_event_repo():
-    return MagicMock()
+# pytest.raises(match=...) accepts compiled patterns; build them once
+_EVENT1_RE = re.compile(re.escape("Event 1"))
+_NO_USER_RE = re.compile(re.escape("No user found with email email@example.com"))
 
+# Built once at import: User(password=...) runs the password hasher. Tests only hand it
+# to stubs and compare by identity, so it is never mutated.
+ORGANIZER = User(id=1, name="Name", surname="Surname", email="email@example.com", password="secret")
 
-@pytest.fixture
-def mock_user_repo():
-    return MagicMock()
 
+# -------------------------------
+# Fixtures
+# -------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_embedding_service():
-    m = MagicMock()
-    # embedding service is awaited by the async service methods
-    m.create_embedding = AsyncMock()
-    return m
+    # create_embedding is async on the interface, so the spec'd Mock makes it an AsyncMock
+    return Mock(spec_set=EmbeddingService)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def event_service(mock_event_repo, mock_user_repo, mock_embedding_service):
+    # The service only holds references to the shared mocks, so one instance per module is enough.
     return EventServiceImpl(
         event_repository=mock_event_repo,
         user_repository=mock_user_repo,
@@ -116,189 +71,165 @@ def event_service(mock_event_repo, mock_user_repo, mock_embedding_service):
     )
 
 
-# -------------------------------
-# Sync GET / DELETE tests
-# -------------------------------
+@pytest.fixture(autouse=True)
+def _reset_embedding_service(mock_embedding_service):
+    """The repo mocks are reset by the conftest; the module's embedding mock is reset here."""
+    yield
+    mock_embedding_service.reset_mock(return_value=True, side_effect=True)
 
-def test_get_by_title_success(event_service, mock_event_repo, patch_db_session):
-    organizer = User(id=1, name="Name", surname="Surname", email="email@example.com", password="secret")
-    event = Event(id=1, title="Event 1", organizer=organizer, datetime=datetime.now(),
-                  description="Event description", organizer_id=organizer.id,
-                  location="Location 1", category="category")
-    mock_event_repo.get_by_title.return_value = event
 
-    result = event_service.get_by_title("Event 1")
+@pytest.fixture
+def stub_event_service(mock_user_repo, mock_embedding_service):
+    """
+    Factory for an EventServiceImpl over a StubRepo with canned returns, for lookups
+    that only check the result and the repository argument.
+    """
+    def _make(**returns):
+        return EventServiceImpl(
+            event_repository=StubRepo(**returns),
+            user_repository=mock_user_repo,
+            embedding_service=mock_embedding_service,
+        )
+    return _make
 
-    mock_event_repo.get_by_title.assert_called_once_with("Event 1", ANY)
-    assert result == event
 
+@pytest.fixture(scope="session")
+def default_event():
+    """
+    ORGANIZER's "Event 1", built once for tests that never mutate it.
+    Only organizer_id is linked: setting the relationship would back-populate the shared
+    ORGANIZER's organized_events across tests.
+    """
+    return make_event(id=1, **EVENT_1_FIELDS, organizer_id=ORGANIZER.id)
+
+
+# -------------------------------
+# Sync GET / DELETE tests
+# -------------------------------
 
 def test_get_by_title_raises_if_not_found(event_service, mock_event_repo, patch_db_session):
     mock_event_repo.get_by_title.return_value = None
 
-    with pytest.raises(EventNotFoundException, match="Event 1"):
+    with pytest.raises(EventNotFoundException, match=_EVENT1_RE):
         event_service.get_by_title("Event 1")
 
-    mock_event_repo.get_by_title.assert_called_once_with("Event 1", ANY)
+    assert_called_once_each({mock_event_repo.get_by_title: ("Event 1",)})
 
 
-def test_get_by_category(event_service, mock_event_repo, patch_db_session):
-    events = [Event(id=1, title="E", organizer_id=1, datetime=datetime.now(),
-                    description="d", location="L", category="category")]
-    mock_event_repo.get_by_category.return_value = events
+@pytest.mark.parametrize("method,args", [
+    ("get_by_title", ("Event 1",)),
+    ("get_by_category", ("category",)),
+    ("get_by_location", ("Location 1",)),
+    ("get_by_date", (FROZEN_NOW,)),
+    ("get_all", ()),
+])
+def test_simple_lookup(stub_event_service, patch_db_session, method, args):
+    # The service hands back whatever the repo returned, so an opaque sentinel is enough
+    service = stub_event_service(**{method: sentinel.result})
 
-    result = event_service.get_by_category("category")
+    result = getattr(service, method)(*args)
 
-    mock_event_repo.get_by_category.assert_called_once_with("category", ANY)
-    assert result == events
+    assert service.event_repository.calls[method] == [(*args, patch_db_session)]
+    assert result is sentinel.result
 
 
-def test_get_by_location(event_service, mock_event_repo, patch_db_session):
-    events = [Event(id=1, title="E", organizer_id=1, datetime=datetime.now(),
-                    description="d", location="Location 1", category="category")]
-    mock_event_repo.get_by_location.return_value = events
-
-    result = event_service.get_by_location("Location 1")
-
-    mock_event_repo.get_by_location.assert_called_once_with("Location 1", ANY)
-    assert result == events
-
-
-def test_get_by_date(event_service, mock_event_repo, patch_db_session):
-    dt = datetime.now()
-    events = [Event(id=1, title="E", organizer_id=1, datetime=dt,
-                    description="d", location="L", category="C")]
-    mock_event_repo.get_by_date.return_value = events
-
-    result = event_service.get_by_date(dt)
-
-    mock_event_repo.get_by_date.assert_called_once_with(dt, ANY)
-    assert result == events
-
-
-def test_get_by_organizer_success(event_service, mock_user_repo, mock_event_repo, patch_db_session):
-    organizer = User(id=1, name="Name", surname="Surname", email="email@example.com", password="secret")
-    event = Event(id=1, title="Event 1", organizer=organizer, datetime=datetime.now(),
-                  description="Event description", organizer_id=organizer.id,
-                  location="Location 1", category="category")
+def test_get_by_organizer_success(event_service, mock_user_repo, mock_event_repo, patch_db_session, default_event):
+    organizer = ORGANIZER
+    event = default_event
 
     mock_user_repo.get_by_email.return_value = organizer
     mock_event_repo.get_by_organizer_id.return_value = [event]
 
     result = event_service.get_by_organizer("email@example.com")
 
-    mock_user_repo.get_by_email.assert_called_once_with("email@example.com", ANY)
-    mock_event_repo.get_by_organizer_id.assert_called_once_with(organizer.id, ANY)
+    # One list comparison per repo also proves no other repository calls were made
+    assert mock_user_repo.mock_calls == [call.get_by_email("email@example.com", ANY)]
+    assert mock_event_repo.mock_calls == [call.get_by_organizer_id(organizer.id, ANY)]
     assert result == [event]
 
 
 def test_get_by_organizer_raises_if_user_not_found(event_service, mock_user_repo, patch_db_session):
     mock_user_repo.get_by_email.return_value = None
 
-    with pytest.raises(UserNotFoundException, match="No user found with email email@example.com"):
+    with pytest.raises(UserNotFoundException, match=_NO_USER_RE):
         event_service.get_by_organizer("email@example.com")
 
-    mock_user_repo.get_by_email.assert_called_once_with("email@example.com", ANY)
-
-
-def test_get_all(event_service, mock_event_repo, patch_db_session):
-    organizer1 = User(id=1, name='Name', surname='Surname', email='email', password='secret')
-    event1 = Event(id=1,
-                   title='Event 1',
-                   organizer=organizer1,
-                   datetime=datetime.now(),
-                   description='Event description',
-                   organizer_id=organizer1.id,
-                   location='Location 1',
-                   category='category')
-
-    organizer2 = User(id=2, name='Name', surname='Surname', email='email123', password='secret')
-    event2 = Event(id=2,
-                   title='Event 2',
-                   organizer=organizer2,
-                   datetime=datetime.now(),
-                   description='Event description',
-                   organizer_id=organizer2.id,
-                   location='Location 2',
-                   category='category')
-
-    events = [event1, event2]
-    mock_event_repo.get_all.return_value = events
+    assert_called_once_each({mock_user_repo.get_by_email: ("email@example.com",)})
 
-    result = event_service.get_all()
 
-    mock_event_repo.get_all.assert_called_once_with(ANY)
-    assert result == events
-
-
-def test_delete_by_title_success(event_service, mock_event_repo, patch_db_session):
-    organizer = User(id=1, name='Name', surname='Surname', email='email', password='secret')
-    event = Event(id=1, title='Event 1', organizer=organizer, datetime=datetime.now(),
-                  description='Event description', organizer_id=organizer.id,
-                  location='Location 1', category='category')
+def test_delete_by_title_success(event_service, mock_event_repo, patch_db_session, default_event):
+    event = default_event
     mock_event_repo.get_by_title.return_value = event
 
-    # sanity (non-decorated direct read or decorated; don't assert session identity)
-    result = event_service.get_by_title("Event 1")
-    assert result == event
-    mock_event_repo.get_by_title.assert_any_call("Event 1", ANY)
-
     # decorated call uses its own session
     event_service.delete_by_title("Event 1")
-    mock_event_repo.delete_by_title.assert_called_once_with("Event 1", ANY)
+    assert_called_once_each({mock_event_repo.delete_by_title: ("Event 1",)})
 
 
 def test_delete_by_title_raises_if_not_found(event_service, mock_event_repo, patch_db_session):
     mock_event_repo.get_by_title.return_value = None
 
-    with pytest.raises(EventNotFoundException, match="Event 1"):
+    with pytest.raises(EventNotFoundException, match=_EVENT1_RE):
         event_service.delete_by_title("Event 1")
 
 
-def test_delete_by_title_wraps_repository_errors(event_service, mock_event_repo, patch_db_session):
-    organizer = User(id=1, name='Name', surname='Surname', email='email', password='secret')
-    event = Event(id=1, title='Event 1', organizer=organizer, datetime=datetime.now(),
-                  description='Event description', organizer_id=organizer.id,
-                  location='Location 1', category='category')
+def test_delete_by_title_wraps_repository_errors(event_service, mock_event_repo, patch_db_session, default_event):
+    event = default_event
 
-    mock_event_repo.get_by_title.return_value = event
-    mock_event_repo.delete_by_title.side_effect = RuntimeError("db down")
+    mock_event_repo.configure_mock(**{
+        "get_by_title.return_value": event,
+        "delete_by_title.side_effect": RuntimeError("db down"),
+    })
 
-    with pytest.raises(EventDeleteException):
+    with pytest.raises(EventDeleteException, check=lambda e: isinstance(e.original_exception, RuntimeError)):
         event_service.delete_by_title("Event 1")
 
-    mock_event_repo.get_by_title.assert_called_with("Event 1", ANY)
-    mock_event_repo.delete_by_title.assert_called_once_with("Event 1", ANY)
+    assert mock_event_repo.mock_calls == [
+        call.get_by_title("Event 1", ANY),
+        call.delete_by_title("Event 1", ANY),
+    ]
 
 
 # -------------------------------
 # ASYNC create() tests
 # -------------------------------
 
+@pytest.fixture(scope="module")
+def make_payload():
+    """Factory for a fresh create() payload: BASE_PAYLOAD plus overrides."""
+    def _make(**overrides):
+        return dict(BASE_PAYLOAD, **overrides)
+    return _make
+
+
 @pytest.mark.asyncio
-async def test_create_event(event_service, mock_event_repo, mock_user_repo, mock_embedding_service, patch_db_session):
-    organizer = User(id=1, name='Name', surname='Surname', email='email', password='secret')
+async def test_create_raises_on_duplicate_title(event_service, mock_event_repo, mock_embedding_service,
+                                                patch_db_session, make_payload):
+    mock_event_repo.get_by_title.return_value = make_event(title='DupEvent')
+
+    with pytest.raises(EventAlreadyExistsException, match='DupEvent'):
+        await event_service.create(make_payload(title='DupEvent'))
+
+    mock_embedding_service.create_embedding.assert_not_called()
+    mock_event_repo.save.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_event(event_service, mock_event_repo, mock_user_repo, mock_embedding_service, patch_db_session,
+                            make_payload):
+    organizer = ORGANIZER
     mock_user_repo.get_by_email.return_value = organizer
-    # create(): pre-check duplicate, then _persist TOCTOU recheck => two calls
-    mock_event_repo.get_by_title.side_effect = [None, None]
-
-    payload = {
-        'title':           'Event 1',
-        'description':     'Event description',
-        'datetime':        datetime.now(),
-        'location':        'Location 1',
-        'category':        'category',
-        'organizer_email': organizer.email
-    }
+
+    payload = make_payload(organizer_email=organizer.email)
 
     # embedding result
     mock_embedding_service.create_embedding.return_value = [0.1, 0.2, 0.3]
 
-    # Let save() return the SAME object it was given (and set id)
-    def _save(e, session):
-        e.id = 42
-        return e
-    mock_event_repo.save.side_effect = _save
+    mock_event_repo.configure_mock(**{
+        # create(): pre-check duplicate, then _persist TOCTOU recheck => two calls
+        'get_by_title.side_effect': [None, None],
+        # save() returns the SAME object it was given
+        'save.side_effect': echo_saved,
+    })
 
     result = await event_service.create(payload)
 
@@ -306,4 +237,56 @@ async def test_create_event(event_service, mock_event_repo, mock_user_repo, mock
     assert [args[0] for args, _ in mock_event_repo.get_by_title.call_args_list] == ['Event 1', 'Event 1']
 
     # save happens inside the decorator transaction -> ANY session
-    mock_event_repo.save.assert_called_once()
\ No newline at end of file
+    mock_event_repo.save.assert_called_once()
+
+    # The embedding was computed from the saved event's formatted text; format it once
+    expected_text = format_event(result)
+    assert mock_embedding_service.create_embedding.call_count == 1
+    assert mock_embedding_service.create_embedding.call_args.args[0] == expected_text
+    assert result.embedding == [0.1, 0.2, 0.3]
+
+# -------------------------------
+# ASYNC update() tests
+# -------------------------------
+
+@pytest.fixture
+def primed_event_repo(mock_event_repo):
+    """Existing event plus a repo stub that finds it in both the read and write phase."""
+    event = make_event(id=1, **EVENT_1_FIELDS)
+    mock_event_repo.get_by_title.return_value = event
+    return event, mock_event_repo
+
+
+@pytest.mark.asyncio
+async def test_update_success(event_service, primed_event_repo, mock_embedding_service, patch_db_session):
+    event, repo = primed_event_repo
+    mock_embedding_service.create_embedding.return_value = [0.4, 0.5]
+
+    result = await event_service.update("Event 1", {"description": "New description"})
+
+    assert result is event
+    assert event.description == "New description"
+    assert event.embedding == [0.4, 0.5]
+    assert [args[0] for args, _ in repo.get_by_title.call_args_list] == ["Event 1", "Event 1"]
+    # The patched event formats exactly like the temporary one the service embedded
+    assert mock_embedding_service.create_embedding.call_args.args[0] == format_event(event)
+
+
+@pytest.mark.asyncio
+async def test_update_raises_if_not_found(event_service, mock_event_repo, mock_embedding_service, patch_db_session):
+    mock_event_repo.get_by_title.return_value = None
+
+    with pytest.raises(EventNotFoundException, match=_EVENT1_RE):
+        await event_service.update("Event 1", {"description": "x"})
+
+    mock_embedding_service.create_embedding.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_raises_if_deleted_before_write(event_service, primed_event_repo, patch_db_session):
+    event, repo = primed_event_repo
+    # Found in the read phase, gone by the transactional write
+    repo.get_by_title.side_effect = [event, None]
+
+    with pytest.raises(EventNotFoundException, match="no longer exists"):
+        await event_service.update("Event 1", {"description": "x"})
@@ -1,106 +1,145 @@
 # tests/test_database_concurrency.py
 import concurrent.futures
-from datetime import datetime, UTC
-import asyncio
 import pytest
+from flask import Flask
+from sqlalchemy import func, select, text
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.exc import StaleDataError
 
-from app import create_app
 from app.extensions import db
 from app.models.event import Event
 from app.models.user import User
+from app.repositories.event_repository_impl import EventRepositoryImpl
+from app.repositories.user_repository_impl import UserRepositoryImpl
+from app.services.app_service_impl import AppServiceImpl, UniqueViolation
+from app.services.event_service_impl import EventServiceImpl
 from app.util.transaction_util import transactional, retry_conflicts
 from app.error_handler.exceptions import (
     ConcurrencyException,
+    EventAlreadyExistsException,
     UserAlreadyInEventException,
 )
-from tests.util.util_test import test_cfg
+from tests.util.stubs import NOW, ClashingEmbedStub
 
+pytestmark = pytest.mark.slow
 
-@pytest.fixture(scope="session")
-def app():
-    app = create_app(test_cfg)
+
+def _real_session():
+    """The Session behind Flask-SQLAlchemy 3.x's db.session, which is always a scoped_session."""
+    return db.session()
+
+
+def _count_users(session, email: str) -> int:
+    """Plain SELECT count(*) instead of Query.count()'s wrapping subquery."""
+    return session.scalar(select(func.count()).select_from(User).where(User.email == email))
+
+
+def _seed_user(app, **kwargs) -> int:
+    """Insert and commit a user through the app's request-scoped session; return its id."""
     with app.app_context():
-        db.drop_all()
-        db.create_all()
-        yield app
-        db.session.remove()
+        user = User(**kwargs)
+        db.session.add(user)
+        db.session.commit()
+        return user.id
 
 
 @pytest.fixture(scope="session")
 def engine(app):
-    return db.engine
+    with app.app_context():
+        return db.engine
 
 
 @pytest.fixture(autouse=True)
-def clean_db(app):
+def clean_db(request, app):
+    if "db_savepoint" in request.fixturenames:
+        return  # rolled back by the outer transaction instead
     with app.app_context():
-        for table in reversed(db.metadata.sorted_tables):
-            db.session.execute(table.delete())
+        # One round trip: psycopg2 accepts several ;-separated statements in a single execute
+        quote = db.engine.dialect.identifier_preparer.format_table
+        db.session.execute(text(";".join(
+            f"DELETE FROM {quote(table)}" for table in reversed(db.metadata.sorted_tables)
+        )))
         db.session.commit()
 
 
-@pytest.fixture(scope="function")
-def Session(engine):
-    return sessionmaker(bind=engine)
+@pytest.fixture(scope="module")
+def event_service():
+    # Services are stateless; tests that need a specific embedding stub monkeypatch it in
+    return EventServiceImpl(EventRepositoryImpl(), UserRepositoryImpl(), embedding_service=None)
 
 
-@pytest.fixture(autouse=True)
-def clean_db(app):
+@pytest.fixture(scope="module")
+def app_service():
+    return AppServiceImpl(UserRepositoryImpl(), EventRepositoryImpl())
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def db_savepoint(app, engine, monkeypatch):
+    """
+    Run the test inside one outer transaction that is rolled back at teardown.
+    db.session is bound to that connection with join_transaction_mode="create_savepoint",
+    so begin/commit inside the code under test only open and release SAVEPOINTs.
+    Only for tests that use the app's db.session exclusively; tests that need commits
+    visible to other connections keep relying on clean_db.
+    """
     with app.app_context():
-        for table in reversed(db.metadata.sorted_tables):
-            db.session.execute(table.delete())
-        db.session.commit()
+        connection = engine.connect()
+        outer = connection.begin()
+        session = scoped_session(sessionmaker(bind=connection, join_transaction_mode="create_savepoint"))
+        monkeypatch.setattr(db, "session", session)
+        try:
+            yield session
+        finally:
+            session.remove()
+            outer.rollback()
+            connection.close()
 
 
-def test_db_two_sessions_conflict_raises_staledataerror(Session):
-    s0 = Session()
-    u = User(name="A", surname="B", email="a@b.com", password="pw")
-    s0.add(u)
-    s0.commit()
-    uid = u.id
-    s0.close()
+@pytest.fixture(scope="session")
+def Session(engine):
+    # Shared factory; each Session() still checks out its own connection and must be closed explicitly
+    return sessionmaker(bind=engine)
 
-    s1 = Session()
-    s2 = Session()
 
-    u1 = s1.get(User, uid)
-    u2 = s2.get(User, uid)
+def test_db_two_sessions_conflict_raises_staledataerror(app, Session):
+    uid = _seed_user(app, name="A", surname="B", email="a@b.com", password="pw")
+
+    # close() discards the failed transaction, so no explicit rollback is needed
+    with Session() as s1, Session() as s2:
+        u1 = s1.get(User, uid)
+        u2 = s2.get(User, uid)
 
-    u1.name = "first"
-    s1.commit()
-    s1.close()
+        u1.name = "first"
+        s1.commit()
 
-    u2.name = "second"
-    with pytest.raises(StaleDataError):
-        s2.commit()
-    s2.rollback()
-    s2.close()
+        u2.name = "second"
+        with pytest.raises(StaleDataError):
+            s2.commit()
 
 
 def test_service_level_decorator_converts_and_retries(app, Session):
-    with app.app_context():
-        base = User(name="X", surname="Y", email="x@y.com", password="pw")
-        db.session.add(base)
-        db.session.commit()
-        uid = base.id
+    uid = _seed_user(app, name="X", surname="Y", email="x@y.com", password="pw")
 
     calls = {"n": 0}
 
-    @retry_conflicts(max_retries=2, backoff_sec=0)
+    @retry_conflicts(max_retries=2, backoff_sec=0, _sleep=lambda _: None)
     @transactional
     def update_name(new_name: str, session=None):
         calls["n"] += 1
         u = session.get(User, uid)
 
         if calls["n"] == 1:
-            s2 = Session()
-            u2 = s2.get(User, uid)
-            u2.name = "external-bump"
-            s2.commit()
-            s2.close()
+            with Session() as s2:
+                s2.get(User, uid).name = "external-bump"
+                s2.commit()
 
         u.name = new_name
 
@@ -111,51 +150,35 @@ def test_service_level_decorator_converts_and_retries(app, Session):
         assert calls["n"] == 2
 
 
-def test_delete_vs_update_conflict_raises_staledataerror(Session):
-    s0 = Session()
-    u = User(name="Del", surname="U", email="del@u.com", password="pw")
-    s0.add(u)
-    s0.commit()
-    uid = u.id
-    s0.close()
-
-    s1 = Session()
-    s2 = Session()
+def test_delete_vs_update_conflict_raises_staledataerror(app, Session):
+    uid = _seed_user(app, name="Del", surname="U", email="del@u.com", password="pw")
 
-    u1 = s1.get(User, uid)
-    u2 = s2.get(User, uid)
+    with Session() as s1, Session() as s2:
+        u1 = s1.get(User, uid)
+        u2 = s2.get(User, uid)
 
-    s1.delete(u1)
-    s1.commit()
-    s1.close()
+        s1.delete(u1)
+        s1.commit()
 
-    u2.name = "should-fail"
-    with pytest.raises(StaleDataError):
-        s2.commit()
-    s2.rollback()
-    s2.close()
+        u2.name = "should-fail"
+        with pytest.raises(StaleDataError):
+            s2.commit()
 
 
 def test_retry_exhaustion_bubbles_concurrency_exception(app, Session):
-    with app.app_context():
-        base = User(name="Retry", surname="X", email="retry@x.com", password="pw")
-        db.session.add(base)
-        db.session.commit()
-        uid = base.id
+    uid = _seed_user(app, name="Retry", surname="X", email="retry@x.com", password="pw")
 
     attempts = {"n": 0}
 
-    @retry_conflicts(max_retries=2, backoff_sec=0)
+    @retry_conflicts(max_retries=2, backoff_sec=0, _sleep=lambda _: None)
     @transactional
     def update_always_conflict(session=None):
         attempts["n"] += 1
         u = session.get(User, uid)
 
-        s2 = Session()
-        u2 = s2.get(User, uid)
-        u2.name = f"external-{attempts['n']}"
-        s2.commit()
-        s2.close()
+        with Session() as s2:
+            s2.get(User, uid).name = f"external-{attempts['n']}"
+            s2.commit()
 
         u.name = "txn-attempt"
 
@@ -173,7 +196,7 @@ def test_nested_transactional_maps_at_outermost(app):
         calls["inner"] += 1
         raise StaleDataError("forced-inner-stale")
 
-    @retry_conflicts(max_retries=1, backoff_sec=0)
+    @retry_conflicts(max_retries=1, backoff_sec=0, _sleep=lambda _: None)
     @transactional
     def outer(session=None):
         calls["outer"] += 1
@@ -190,12 +213,16 @@ def test_request_scoped_db_session_identity_same(app):
         s1 = db.session
         s2 = db.session
         assert s1 is s2
-        s1_real = s1() if callable(s1) else s1
-        s2_real = s2() if callable(s2) else s2
+        s1_real = s1()
+        s2_real = s2()
         assert s1_real is s2_real
 
 
-def test_http_conflict_mapping_returns_409(app):
+def test_http_conflict_mapping_returns_409():
+    # A throwaway app: the shared session app has already served requests, and Flask
+    # refuses new routes/handlers after the first request
+    app = Flask(__name__)
+
     @app.errorhandler(ConcurrencyException)
     def _handle_concurrency(e):
         return {"error": {"code": "CONCURRENT_UPDATE", "message": str(e)}}, 409
@@ -211,37 +238,21 @@ def test_http_conflict_mapping_returns_409(app):
     assert data["error"]["code"] == "CONCURRENT_UPDATE"
 
 
-def test_split_phase_create_has_no_txn_during_external_call_and_toctou(app, Session):
-    from app.services.event_service_impl import EventServiceImpl
-    from app.repositories.event_repository_impl import EventRepositoryImpl
-    from app.repositories.user_repository_impl import UserRepositoryImpl
-    from app.error_handler.exceptions import EventAlreadyExistsException
-
+@pytest.mark.asyncio(loop_scope="module")
+async def test_split_phase_create_has_no_txn_during_external_call_and_toctou(app, Session, event_service, monkeypatch):
     with app.app_context():
         organizer = User(name="Org", surname="One", email="org@x.com", password="pw")
         db.session.add(organizer)
         db.session.commit()
 
-        class StubEmbed:
-            async def create_embedding(self, payload):
-                real = db.session() if callable(db.session) else db.session
-                assert real.get_transaction() is None
-                s2 = Session()
-                e = Event(title="Clash", description="rival", organizer_id=organizer.id)
-                e.datetime = datetime.now(UTC)
-                s2.add(e)
-                s2.commit()
-                s2.close()
-                return [0.1, 0.2, 0.3]
-
-        svc = EventServiceImpl(EventRepositoryImpl(), UserRepositoryImpl(), StubEmbed())
+        monkeypatch.setattr(event_service, "embedding_service", ClashingEmbedStub(Session, organizer.id))
 
         data = {"title": "Clash", "description": "d", "organizer_email": "org@x.com"}
         with pytest.raises(EventAlreadyExistsException):
-            asyncio.run(svc.create(data))
+            await event_service.create(data)
 
 
-def test_transactional_joins_outer_and_rolls_back_once(app):
+def test_transactional_joins_outer_and_rolls_back_once(app, db_savepoint):
     @transactional
     def inner_create_user(email: str, session=None):
         session.add(User(name="Inner", surname="X", email=email, password="pw"))
@@ -254,41 +265,41 @@ def test_transactional_joins_outer_and_rolls_back_once(app):
     with app.app_context():
         with pytest.raises(RuntimeError):
             outer_wrapper()
-        assert db.session.query(User).filter_by(email="join@test.com").count() == 0
+        assert _count_users(db.session, "join@test.com") == 0
 
 
-def test_retry_conflicts_rolls_back_between_attempts(app):
+def test_retry_conflicts_rolls_back_between_attempts(app, db_savepoint):
     calls = {"n": 0}
 
-    @retry_conflicts(max_retries=2, backoff_sec=0)
+    @retry_conflicts(max_retries=2, backoff_sec=0, _sleep=lambda _: None)
     @transactional
     def do_work(session=None):
         calls["n"] += 1
         if calls["n"] == 1:
             session.add(User(name="Temp", surname="T", email="temp@x.com", password="pw"))
             raise ConcurrencyException("simulate-concurrency")
-        assert session.query(User).filter_by(email="temp@x.com").count() == 0
+        assert _count_users(session, "temp@x.com") == 0
         session.add(User(name="OK", surname="Y", email="ok@x.com", password="pw"))
 
     with app.app_context():
         do_work()
-        assert db.session.query(User).filter_by(email="ok@x.com").count() == 1
+        assert _count_users(db.session, "ok@x.com") == 1
 
 
 def test_request_session_isolation_across_requests(app):
     email = "iso@x.com"
 
     with app.test_request_context():
-        real = db.session() if callable(db.session) else db.session
+        real = _real_session()
         with real.begin_nested() as sp:
             db.session.add(User(name="Iso", surname="L", email=email, password="pw"))
             db.session.flush()
-            assert db.session.query(User).filter_by(email=email).count() == 1
+            assert _count_users(db.session, email) == 1
             sp.rollback()
-        assert db.session.query(User).filter_by(email=email).count() == 0
+        assert _count_users(db.session, email) == 0
 
     with app.test_request_context():
-        assert db.session.query(User).filter_by(email=email).count() == 0
+        assert _count_users(db.session, email) == 0
 
 
 def _session_id_for_request(app, name):
@@ -300,37 +311,36 @@ def _session_id_for_request(app, name):
         return id(session)
 
 
-def test_parallel_request_scoped_sessions_are_different(app):
+def test_parallel_request_scoped_sessions_are_different(app, thread_pool):
     names = ["req1", "req2", "req3", "req4"]
 
     with app.app_context():
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(names)) as executor:
-            results = list(executor.map(lambda n: _session_id_for_request(app, n), names))
+        results = list(thread_pool.map(lambda n: _session_id_for_request(app, n), names))
 
     assert len(set(results)) == len(results)
 
 
-def test_app_service_duplicate_invite_mapping_branch(app, monkeypatch):
-    from app.services.app_service_impl import AppServiceImpl, UniqueViolation
-    from app.repositories.user_repository_impl import UserRepositoryImpl
-    from app.repositories.event_repository_impl import EventRepositoryImpl
-
+def test_app_service_duplicate_invite_mapping_branch(app, db_savepoint, app_service, monkeypatch):
     with app.app_context():
         u = User(name="U", surname="V", email="u@v.com", password="pw")
         db.session.add(u)
-        db.session.commit()
+        db.session.flush()  # assigns u.id without ending the transaction
 
         e = Event(title="E", description="d", organizer_id=u.id)
-        e.datetime = datetime.now(UTC)
+        e.datetime = NOW
         db.session.add(e)
         db.session.commit()
 
-        svc = AppServiceImpl(UserRepositoryImpl(), EventRepositoryImpl())
-
         def fake_save_raises(*args, **kwargs):
             raise IntegrityError("insert into guest_list ...", {}, UniqueViolation())
 
-        monkeypatch.setattr(svc.event_repo, "save", fake_save_raises)
+        monkeypatch.setattr(app_service.event_repo, "save", fake_save_raises)
 
         with pytest.raises(UserAlreadyInEventException):
-            svc.add_participant_to_event("E", "u@v.com")
+            app_service.add_participant_to_event("E", "u@v.com")
+
+
+def test_zzz_app_schema_built_once(setup_calls):
+    # Runs last in the module: if the shared app fixture regresses to a narrower scope,
+    # create_all would have run once per test above
+    assert setup_calls["create_all"] == 1
@@ -0,0 +1,10 @@
+def assert_called_once_each(expected: dict) -> None:
+    """
+    Assert every mocked method in ``expected`` was called exactly once, with the given
+    leading positional args. Trailing args (the transactional session) are not compared.
+
+        assert_called_once_each({repo.get_by_email: ("a@b.com",), repo.save: (user,)})
+    """
+    actual = {m: (m.call_count, m.call_args.args[:len(args)] if m.call_args else None)
+              for m, args in expected.items()}
+    assert actual == {m: (1, tuple(args)) for m, args in expected.items()}
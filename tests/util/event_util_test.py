@@ -18,19 +18,18 @@ def test_length_constants():
     assert isinstance(LOCATION_MAX_LENGTH, int)
     assert isinstance(CATEGORY_MAX_LENGTH, int)
 
-@pytest.mark.parametrize("event_id", [0, 42, 999])
-def test_return_not_found_by_id_message(event_id):
-    assert return_not_found_by_id_message(event_id) == f"Event not found with id {event_id}"
+# (message builder, value, expected message), with the expected text formatted once at import
+NOT_FOUND_CASES = [
+    (fn, value, f"Event not found with {field} {value}")
+    for fn, field, values in [
+        (return_not_found_by_id_message, "id", (0, 42, 999)),
+        (return_not_found_by_title_message, "title", ("Party", "", "123")),
+        (return_not_found_by_category_message, "category", ("Music", "Sport", "")),
+        (return_not_found_by_location_message, "location", ("Club", "Hall", "")),
+    ]
+    for value in values
+]
 
-@pytest.mark.parametrize("title", ["Party", "", "123"])
-def test_return_not_found_by_title_message(title):
-    assert return_not_found_by_title_message(title) == f"Event not found with title {title}"
-
-@pytest.mark.parametrize("category", ["Music", "Sport", ""])
-def test_return_not_found_by_category_message(category):
-    expected = f"Event not found with category {category}"
-    assert return_not_found_by_category_message(category) == expected
-
-@pytest.mark.parametrize("location", ["Club", "Hall", ""])
-def test_return_not_found_by_location_message(location):
-    assert return_not_found_by_location_message(location) == f"Event not found with location {location}"
+@pytest.mark.parametrize("fn,value,expected", NOT_FOUND_CASES)
+def test_return_not_found_messages(fn, value, expected):
+    assert fn(value) == expected
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from app.models.event import Event
+
+# Resolved once; callers override only the fields their test cares about
+EVENT_DEFAULTS = {
+    "title": "Test Event",
+    "description": "An event for testing",
+    "datetime": datetime(2025, 1, 1, 10, 0, 0),
+    "location": "Skopje",
+    "category": "Tech",
+}
+EVENT_FIELDS = tuple(EVENT_DEFAULTS)
+
+
+def make_event(**overrides) -> Event:
+    """
+    Build a transient Event from EVENT_DEFAULTS plus the given overrides.
+    Relationships (organizer, guests) are only set when passed explicitly, so no
+    shared User accumulates back-populated events across tests.
+    """
+    return Event(**{**EVENT_DEFAULTS, **overrides})
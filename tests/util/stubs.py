@@ -0,0 +1,62 @@
+from collections import defaultdict
+from datetime import datetime, UTC
+
+from app.extensions import db
+from app.models.event import Event
+
+# The stub only needs a valid timestamp, not the current one; fixed for deterministic runs
+NOW = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+
+class ClashingEmbedStub:
+    """
+    Embedding service stub for split-phase tests.
+
+    While "computing" the embedding it asserts that the caller holds no open transaction,
+    then commits a rival event with the same title through an independent session,
+    simulating a concurrent writer between the read and write phases.
+    """
+
+    def __init__(self, Session, organizer_id: int, title: str = "Clash"):
+        self.Session = Session
+        self.organizer_id = organizer_id
+        self.title = title
+
+    async def create_embedding(self, payload):
+        assert db.session().get_transaction() is None
+        with self.Session() as s2:
+            e = Event(title=self.title, description="rival", organizer_id=self.organizer_id)
+            e.datetime = NOW
+            s2.add(e)
+            s2.commit()
+        return [0.1, 0.2, 0.3]
+
+
+class StubRepo:
+    """
+    Minimal repository double for read-only lookups that need no spec checking.
+
+    Every method returns the value registered for its name in ``returns`` (raising it
+    if it is an exception, ``None`` if unregistered) and records its positional args
+    in ``calls[name]``.
+    """
+
+    __slots__ = ("returns", "calls")
+
+    def __init__(self, **returns):
+        self.returns = returns
+        self.calls = defaultdict(list)
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            self.calls[name].append(args)
+            value = self.returns.get(name)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        return method
+
+
+def echo_saved(entity, session=None):
+    """Side effect for a mocked repository save(): hands back the entity it was given."""
+    return entity
@@ -0,0 +1,47 @@
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.error_handler.exceptions import ConcurrencyException
+from app.util import transaction_util
+from app.util.transaction_util import retry_conflicts
+
+
+@pytest.fixture(autouse=True)
+def fake_session(monkeypatch):
+    """Stub the session the retry loop rolls back between attempts."""
+    monkeypatch.setattr(transaction_util, "_current_session", lambda: MagicMock())
+
+
+def _always_conflicts(calls):
+    def fn():
+        calls.append(1)
+        raise ConcurrencyException("conflict")
+    return fn
+
+
+def test_retry_conflicts_full_jitter_delays_are_seeded_and_capped():
+    calls, sleeps = [], []
+    wrapped = retry_conflicts(max_retries=5, base_backoff_sec=0.1, max_backoff_sec=0.3,
+                              _rng=random.Random(42).random, _sleep=sleeps.append)(_always_conflicts(calls))
+
+    with pytest.raises(ConcurrencyException):
+        wrapped()
+
+    expected_rng = random.Random(42)
+    caps = [0.1, 0.2, 0.3, 0.3]  # base * 2**(n-1), capped at max_backoff_sec
+    assert len(calls) == 5
+    assert sleeps == [expected_rng.random() * cap for cap in caps]
+    assert all(0 <= d < cap for d, cap in zip(sleeps, caps))
+
+
+def test_retry_conflicts_legacy_zero_backoff_never_sleeps():
+    calls, sleeps = [], []
+    wrapped = retry_conflicts(max_retries=3, backoff_sec=0, _sleep=sleeps.append)(_always_conflicts(calls))
+
+    with pytest.raises(ConcurrencyException):
+        wrapped()
+
+    assert len(calls) == 3
+    assert sleeps == []
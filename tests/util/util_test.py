@@ -1,7 +1,20 @@
 import os
+from types import MappingProxyType
 
-test_cfg = {
+from app.configuration.config import Config
+
+# Built once at import. Only the top-level keys are read-only: the nested engine options
+# (and their connect_args) are still plain dicts shared by every app built from this config
+test_cfg = MappingProxyType({
         "TESTING": True,
         "SQLALCHEMY_DATABASE_URI": f"postgresql://{os.getenv('TEST_DB_USER')}:{os.getenv('TEST_DB_PASSWORD')}"
-        f"@{os.getenv('TEST_DB_HOST')}:{os.getenv('TEST_DB_PORT')}/{os.getenv('TEST_DB_NAME')}"
-    }
+        f"@{os.getenv('TEST_DB_HOST')}:{os.getenv('TEST_DB_PORT')}/{os.getenv('TEST_DB_NAME')}",
+        # LIFO keeps the few hot test connections in use; pre-ping stays on for Postgres.
+        # Test data is disposable, so commits don't wait for the WAL flush (per-session setting,
+        # the server's durability config is untouched).
+        "SQLALCHEMY_ENGINE_OPTIONS": {
+            **Config.SQLALCHEMY_ENGINE_OPTIONS,
+            "pool_use_lifo": True,
+            "connect_args": {"options": "-c synchronous_commit=off"},
+        },
+    })